@@ -1,12 +1,5 @@
 #!/usr/bin/env python3
 import argparse
-import sys
-from pathlib import Path
-
-# Add src directory to path to import oo_client (src layout)
-ROOT = Path(__file__).resolve().parents[1]
-SRC = ROOT / "src"
-sys.path.insert(0, str(SRC))
 
 from mcp_server_openobserve.oo_client import OpenObserveClient
 
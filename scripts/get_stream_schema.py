@@ -1,15 +1,8 @@
 #!/usr/bin/env python3
 import argparse
-import json
-import sys
-from pathlib import Path
-
-# Add src directory to path to import oo_client (src layout)
-ROOT = Path(__file__).resolve().parents[1]
-SRC = ROOT / "src"
-sys.path.insert(0, str(SRC))
 
 from mcp_server_openobserve.client import OpenObserveClient
+from mcp_server_openobserve.jsonutil import dumps
 
 
 def main():
@@ -24,7 +17,7 @@ def main():
 
     try:
         response = client.get_stream_schema(args.stream)
-        print(json.dumps(response, indent=2))
+        print(dumps(response, indent=True))
     except Exception as e:
         print(f"Error getting schema: {e}")
 
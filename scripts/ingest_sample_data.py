@@ -1,48 +1,64 @@
 #!/usr/bin/env python3
 import argparse
 import random
-import sys
 import time
-from pathlib import Path
 
-# Add src directory to path to import oo_client (src layout)
-ROOT = Path(__file__).resolve().parents[1]
-SRC = ROOT / "src"
-sys.path.insert(0, str(SRC))
+from mcp_server_openobserve.oo_client import OpenObserveClient, positive_int
+
+LEVELS = ["INFO", "WARN", "ERROR", "DEBUG"]
+SERVICES = ["auth", "payment", "frontend", "backend"]
+LATENCY_RANGE = range(10, 501)  # same bounds as random.randint(10, 500)
+
+
+def generate_records(start, count, timestamp):
+    """Build `count` sample records numbered from `start`."""
+    # Draw every random field up front, then assemble records in a single pass
+    level_draws = random.choices(LEVELS, k=count)
+    service_draws = random.choices(SERVICES, k=count)
+    latency_draws = random.choices(LATENCY_RANGE, k=count)
+    return [
+        {
+            "timestamp": timestamp,
+            "level": level,
+            "service": service,
+            "message": f"Sample log message {i+1}",
+            "latency": latency,
+        }
+        for i, (level, service, latency) in enumerate(
+            zip(level_draws, service_draws, latency_draws), start
+        )
+    ]
 
-from mcp_server_openobserve.oo_client import OpenObserveClient
 
 def main():
     parser = argparse.ArgumentParser(description="Ingest sample logs into a stream")
     parser.add_argument("--stream", default="sample_logs", help="Stream name (default: sample_logs)")
-    parser.add_argument("--count", type=int, default=10, help="Number of records to ingest (default: 10)")
-    
+    parser.add_argument("--count", type=positive_int, default=10, help="Number of records to ingest (default: 10)")
+    parser.add_argument(
+        "--chunk-size",
+        type=positive_int,
+        default=10000,
+        help="Records generated and posted per request (default: 10000)",
+    )
+
     args = parser.parse_args()
-    
+
     client = OpenObserveClient()
-    records = []
-    
-    levels = ["INFO", "WARN", "ERROR", "DEBUG"]
-    services = ["auth", "payment", "frontend", "backend"]
-    
+
     print(f"Generating {args.count} sample records for stream '{args.stream}'...")
-    
-    for i in range(args.count):
-        record = {
-            "timestamp": int(time.time() * 1000000), # microseconds
-            "level": random.choice(levels),
-            "service": random.choice(services),
-            "message": f"Sample log message {i+1}",
-            "latency": random.randint(10, 500)
-        }
-        records.append(record)
-        
+
+    timestamp = time.time_ns() // 1000  # microseconds
+    ingested = 0
     try:
-        response = client.ingest_json(args.stream, records)
-        print("Ingestion response:", response)
-        print(f"Successfully ingested {len(records)} records into '{args.stream}'.")
+        for chunk_start in range(0, args.count, args.chunk_size):
+            size = min(args.chunk_size, args.count - chunk_start)
+            records = generate_records(chunk_start, size, timestamp)
+            response = client.ingest_json(args.stream, records)
+            ingested += len(records)
+            print("Ingestion response:", response)
+        print(f"Successfully ingested {ingested} records into '{args.stream}'.")
     except Exception as e:
-        print(f"Error ingesting data: {e}")
+        print(f"Error ingesting data after {ingested} records: {e}")
 
 if __name__ == "__main__":
     main()
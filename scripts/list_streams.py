@@ -1,12 +1,6 @@
 #!/usr/bin/env python3
 import json
 import sys
-from pathlib import Path
-
-# Add src directory to path to import oo_client (src layout)
-ROOT = Path(__file__).resolve().parents[1]
-SRC = ROOT / "src"
-sys.path.insert(0, str(SRC))
 
 from mcp_server_openobserve.oo_client import OpenObserveClient
 
@@ -14,9 +8,12 @@ def main():
     client = OpenObserveClient()
     response = client.get(f"api/{client.org}/streams")
     
-    print(f"{'Stream Name':<30} | {'Type':<10} | {'Docs':<10} | {'Size (MB)':<10}")
-    print("-" * 70)
-    
+    row_fmt = "{:<30} | {:<10} | {:<10} | {:<10.2f}".format
+    lines = [
+        f"{'Stream Name':<30} | {'Type':<10} | {'Docs':<10} | {'Size (MB)':<10}",
+        "-" * 70,
+    ]
+
     for stream in response.get('list', []):
         name = stream.get('name', 'N/A')
         stream_type = stream.get('stream_type', 'N/A')
@@ -24,8 +21,12 @@ def main():
         doc_num = stats.get('doc_num', 0)
         storage_size = stats.get('storage_size', 0.0)
         size_mb = storage_size / (1024 * 1024)
-        
-        print(f"{name:<30} | {stream_type:<10} | {doc_num:<10} | {size_mb:<10.2f}")
+
+        lines.append(row_fmt(name, stream_type, doc_num, size_mb))
+
+    # One write for the whole table instead of a print() per stream
+    lines.append("")
+    sys.stdout.write("\n".join(lines))
 
 if __name__ == "__main__":
     main()
@@ -27,7 +27,23 @@ import asyncio
 import os
 from typing import Any
 
-from pydantic_ai.mcp import MCPServerStdio, MCPServerStreamableHTTP
+
+def _positive_int(value: str) -> int:
+    """argparse type for integers >= 1."""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, got {value}")
+    return number
+
+
+def _run(coro: Any) -> None:
+    """Run ``coro`` on uvloop when it is installed, else on the default asyncio loop."""
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(coro)
+    else:
+        uvloop.run(coro)
 
 
 async def _print_tools(server: Any) -> None:
@@ -38,27 +54,37 @@ async def _print_tools(server: Any) -> None:
 
 
 async def _run_smoke_calls(server: Any, sql: str, hours: int, size: int) -> None:
-    print("\nCalling list_streams …")
-    streams = await server.direct_call_tool("list_streams", {})
-    print(streams)
-
+    # The calls are independent, so issue them concurrently
+    calls = [server.direct_call_tool("list_streams", {})]
     if sql:
-        print("\nCalling search_sql …")
-        result = await server.direct_call_tool(
-            "search_sql",
-            {
-                "sql": sql,
-                "hours": hours,
-                "size": size,
-                "offset": 0,
-            },
+        calls.append(
+            server.direct_call_tool(
+                "search_sql",
+                {
+                    "sql": sql,
+                    "hours": hours,
+                    "size": size,
+                    "offset": 0,
+                },
+            )
         )
-        print(result)
+    print("\nCalling list_streams" + (" and search_sql" if sql else "") + " …")
+    results = await asyncio.gather(*calls)
+
+    print("\nlist_streams:")
+    print(results[0])
+
+    if sql:
+        print("\nsearch_sql:")
+        print(results[1])
 
 
 async def _run_http(
     url: str, token: str | None, sql: str, hours: int, size: int
 ) -> None:
+    # Imported here so `--help` does not pay for loading pydantic_ai
+    from pydantic_ai.mcp import MCPServerStreamableHTTP
+
     headers = {}
     if token:
         headers["Authorization"] = f"Bearer {token}"
@@ -75,6 +101,8 @@ async def _run_stdio(
     hours: int,
     size: int,
 ) -> None:
+    from pydantic_ai.mcp import MCPServerStdio
+
     # NOTE: MCPServerStdio does not inherit env vars by default.
     server = MCPServerStdio(command, args=args, env=dict(os.environ))
     async with server:
@@ -89,8 +117,8 @@ def main() -> int:
     parser.add_argument(
         "--sql", default="", help="SQL query (must reference a stream/table)"
     )
-    parser.add_argument("--hours", type=int, default=1)
-    parser.add_argument("--size", type=int, default=10)
+    parser.add_argument("--hours", type=_positive_int, default=1)
+    parser.add_argument("--size", type=_positive_int, default=10)
 
     sub = parser.add_subparsers(dest="transport", required=True)
 
@@ -116,7 +144,7 @@ def main() -> int:
     args = parser.parse_args()
 
     if args.transport == "http":
-        asyncio.run(
+        _run(
             _run_http(
                 url=args.url,
                 token=args.token,
@@ -126,7 +154,7 @@ def main() -> int:
             )
         )
     else:
-        asyncio.run(
+        _run(
             _run_stdio(
                 command=args.command,
                 args=args.args,
@@ -1,16 +1,22 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 
+import functools
 import os
 import pprint
 import sys
 import readline
 import atexit
 import argparse
+import asyncio
+from typing import TYPE_CHECKING, Any, Callable
 
-from pydantic_ai import Agent
-from pydantic_ai import messages as mcp_messages
-from pydantic_ai.mcp import MCPServerStreamableHTTP
+# pydantic_ai pulls in pydantic, httpx and the model provider SDKs; import it
+# only once argument parsing has succeeded so `--help` stays instant.
+if TYPE_CHECKING:
+    from pydantic_ai import Agent
+    from pydantic_ai import messages as mcp_messages
+    from pydantic_ai.mcp import MCPServerStreamableHTTP
 
 SYSTEM_PROMPT = """
 You are an expert OpenObserve Assistant. Your goal is to help users query and analyze their logs and observability data.
@@ -35,8 +41,34 @@ COLOR_CYAN = "\x1b[36m"
 COLOR_MAGENTA = "\x1b[35m"
 
 MAX_CONTENT_CHARS = int(os.getenv("MCP_AGENT_MAX_CHARS", "4000"))
+HISTORY_LENGTH = 1000
 
 
+def _setup_history(history_file: str) -> Callable[[], None]:
+    """Load readline history and return a function that appends new entries to it."""
+    try:
+        readline.read_history_file(history_file)
+    except FileNotFoundError:
+        # append_history_file() does not create the file
+        open(history_file, "a").close()
+    readline.set_history_length(HISTORY_LENGTH)
+    if readline.get_current_history_length() > HISTORY_LENGTH:
+        # Trim an oversized file once; every later save only appends
+        readline.write_history_file(history_file)
+    saved = readline.get_current_history_length()
+
+    def flush() -> None:
+        nonlocal saved
+        current = readline.get_current_history_length()
+        if current > saved:
+            readline.append_history_file(current - saved, history_file)
+            saved = current
+
+    return flush
+
+
+# Labels such as 'user:' or 'Error:' repeat for every message, so memoize them
+@functools.lru_cache(maxsize=256)
 def _color(text: str, color: str) -> str:
     if not COLOR_ENABLED:
         return text
@@ -47,13 +79,19 @@ def _format_content(value: object, *, max_chars: int = MAX_CONTENT_CHARS) -> str
     if isinstance(value, str):
         text = value
     else:
-        text = pprint.pformat(value, width=100, compact=False, sort_dicts=True)
+        # repr() is much cheaper than pformat(); skip the pretty-printing (and its
+        # recursive dict sort) when the result would be truncated anyway
+        text = repr(value)
+        if max_chars <= 0 or len(text) <= max_chars:
+            text = pprint.pformat(value, width=100, compact=False, sort_dicts=True)
     if max_chars > 0 and len(text) > max_chars:
         return f"{text[:max_chars]}... [truncated]"
     return text
 
 
 def _print_trace(messages: list[mcp_messages.ModelMessage]) -> None:
+    from pydantic_ai import messages as mcp_messages
+
     for message in messages:
         if isinstance(message, mcp_messages.ModelRequest):
             for part in message.parts:
@@ -92,6 +130,76 @@ log_level = os.getenv("MCP_AGENT_LOG_LEVEL", "WARNING").upper()
 logging.basicConfig(level=getattr(logging, log_level, logging.WARNING))
 logger = logging.getLogger(__name__)
 
+async def _repl(
+    agent: Agent, server: MCPServerStreamableHTTP, flush_history: Callable[[], None]
+) -> None:
+    # Keep one MCP session (and its HTTP connection pool) open for the whole
+    # REPL instead of reconnecting for every prompt. input() blocks the event
+    # loop while waiting for the user, which also stalls the session's
+    # background tasks (its HTTP stream reader, keep-alives) until the prompt
+    # is answered. No tool call is in flight between prompts, so only idle
+    # session traffic waits. asyncio.to_thread(input, ...) would avoid the stall,
+    # but Ctrl-C would then leave the worker thread blocked on stdin and hang
+    # shutdown until Enter; a blocking input() keeps Ctrl-C/Ctrl-D immediate.
+    from pydantic_ai import messages as mcp_messages
+
+    async with server:
+        while True:
+            try:
+                prompt = input("user> ").strip()
+                flush_history()
+            except EOFError:
+                print()
+                break
+            except KeyboardInterrupt:
+                print()
+                break
+
+            if not prompt:
+                continue
+            if prompt == "/exit":
+                break
+
+            try:
+                result = await agent.run(prompt)
+                _print_trace(result.all_messages())
+
+                # Print out the SQL queries used after the response
+                queries = []
+                for msg in result.all_messages():
+                    if isinstance(msg, mcp_messages.ModelResponse):
+                        for part in msg.parts:
+                            if getattr(part, "tool_name", None) == "search_sql":
+                                try:
+                                    args = part.args_as_dict()
+                                    if 'sql' in args and args['sql'] not in queries:
+                                        queries.append(args['sql'])
+                                except Exception:
+                                    pass
+            
+                if queries:
+                    print(f"\n{_color('--- SQL Queries Used ---', COLOR_CYAN)}")
+                    for i, q in enumerate(queries, 1):
+                        print(f"{_color(f'Query {i}:', COLOR_YELLOW)}\n{q}")
+                    print(f"{_color('------------------------', COLOR_CYAN)}\n")
+
+            except Exception as e:
+                print(f"{_color('Error:', COLOR_MAGENTA)} {e}")
+                import traceback
+                traceback.print_exc()
+                print(f"\n{_color('Tip:', COLOR_YELLOW)} If you see 'UnexpectedModelBehavior' or tool errors, check your MCP server logs.")
+                print("Ensure the MCP server is running with valid credentials in .env")
+
+def _run(coro: Any) -> None:
+    """Run ``coro`` on uvloop when it is installed, else on the default asyncio loop."""
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(coro)
+    else:
+        uvloop.run(coro)
+
+
 def main() -> None:
     # Parse command line arguments
     parser = argparse.ArgumentParser(description="OpenObserve MCP Agent CLI")
@@ -103,15 +211,12 @@ def main() -> None:
     )
     args = parser.parse_args()
 
-    # Setup readline history
-    history_file = os.path.expanduser("~/.openobserve_mcp_history")
-    try:
-        readline.read_history_file(history_file)
-    except FileNotFoundError:
-        pass
-    
-    # Save history on exit
-    atexit.register(readline.write_history_file, history_file)
+    from pydantic_ai import Agent
+    from pydantic_ai.mcp import MCPServerStreamableHTTP
+
+    # Setup readline history; new entries are appended after each prompt
+    flush_history = _setup_history(os.path.expanduser("~/.openobserve_mcp_history"))
+    atexit.register(flush_history)
 
     server = MCPServerStreamableHTTP("http://127.0.0.1:8001/mcp", max_retries=5)
     
@@ -124,51 +229,7 @@ def main() -> None:
     agent = Agent(model_name, toolsets=[server], system_prompt=SYSTEM_PROMPT, retries=5)
     
     print('OpenObserve MCP CLI. Type "/exit" to quit.')
-    
-    while True:
-        try:
-            prompt = input("user> ").strip()
-        except EOFError:
-            print()
-            break
-        except KeyboardInterrupt:
-            print()
-            break
-
-        if not prompt:
-            continue
-        if prompt == "/exit":
-            break
-
-        try:
-            result = agent.run_sync(prompt)
-            _print_trace(result.all_messages())
-
-            # Print out the SQL queries used after the response
-            queries = []
-            for msg in result.all_messages():
-                if isinstance(msg, mcp_messages.ModelResponse):
-                    for part in msg.parts:
-                        if getattr(part, "tool_name", None) == "search_sql":
-                            try:
-                                args = part.args_as_dict()
-                                if 'sql' in args and args['sql'] not in queries:
-                                    queries.append(args['sql'])
-                            except Exception:
-                                pass
-            
-            if queries:
-                print(f"\n{_color('--- SQL Queries Used ---', COLOR_CYAN)}")
-                for i, q in enumerate(queries, 1):
-                    print(f"{_color(f'Query {i}:', COLOR_YELLOW)}\n{q}")
-                print(f"{_color('------------------------', COLOR_CYAN)}\n")
-
-        except Exception as e:
-            print(f"{_color('Error:', COLOR_MAGENTA)} {e}")
-            import traceback
-            traceback.print_exc()
-            print(f"\n{_color('Tip:', COLOR_YELLOW)} If you see 'UnexpectedModelBehavior' or tool errors, check your MCP server logs.")
-            print("Ensure the MCP server is running with valid credentials in .env")
+    _run(_repl(agent, server, flush_history))
 
 if __name__ == "__main__":
     main()
@@ -3,20 +3,15 @@ from __future__ import annotations
 
 import argparse
 import atexit
-import json
+import functools
 import os
 import readline
 import sys
 import time
-from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 
-# Add src directory to path to import oo_client (src layout)
-ROOT = Path(__file__).resolve().parents[1]
-SRC = ROOT / "src"
-sys.path.insert(0, str(SRC))
-
-from mcp_server_openobserve.oo_client import OpenObserveClient
+from mcp_server_openobserve.oo_client import OpenObserveClient, positive_int
+from mcp_server_openobserve.jsonutil import dumps
 
 COLOR_ENABLED = sys.stdout.isatty() and os.getenv("NO_COLOR") is None
 COLOR_RESET = "\x1b[0m"
@@ -26,46 +21,70 @@ COLOR_GREEN = "\x1b[32m"
 COLOR_CYAN = "\x1b[36m"
 COLOR_MAGENTA = "\x1b[35m"
 
+HISTORY_LENGTH = 1000
+
+# Error labels and table headers are re-wrapped on every query; cache them
+@functools.lru_cache(maxsize=256)
 def _color(text: str, color: str) -> str:
     if not COLOR_ENABLED:
         return text
     return f"{COLOR_BOLD}{color}{text}{COLOR_RESET}"
 
+def _setup_history(history_file: str) -> Callable[[], None]:
+    """Load readline history and return a function that appends new entries to it."""
+    try:
+        readline.read_history_file(history_file)
+    except FileNotFoundError:
+        # append_history_file() does not create the file
+        open(history_file, "a").close()
+    readline.set_history_length(HISTORY_LENGTH)
+    if readline.get_current_history_length() > HISTORY_LENGTH:
+        # Trim an oversized file once; every later save only appends
+        readline.write_history_file(history_file)
+    saved = readline.get_current_history_length()
+
+    def flush() -> None:
+        nonlocal saved
+        current = readline.get_current_history_length()
+        if current > saved:
+            readline.append_history_file(current - saved, history_file)
+            saved = current
+
+    return flush
+
 def print_table(data: list[dict[str, Any]]) -> None:
     if not data:
         print("No results.")
         return
 
-    # Get all keys from all records to ensure we don't miss any columns
-    # but for large sets we might want to just use the first few or limit it
-    keys = []
-    for row in data:
-        for k in row.keys():
-            if k not in keys:
-                keys.append(k)
-    
-    # Calculate column widths
-    widths = {k: len(str(k)) for k in keys}
-    for row in data:
-        for k in keys:
-            val = str(row.get(k, ""))
-            if len(val) > widths[k]:
-                widths[k] = min(len(val), 50)  # Max width 50
-
-    # Print header
-    header = " | ".join(f"{k:<{widths[k]}}" for k in keys)
-    print(_color(header, COLOR_CYAN))
-    print("-" * len(header))
-
-    # Print rows
-    for row in data:
-        line = " | ".join(f"{str(row.get(k, ''))[:widths[k]]:<{widths[k]}}" for k in keys)
-        print(line)
+    # Get all keys from all records to ensure we don't miss any columns,
+    # deduplicated in first-seen order
+    keys = list(dict.fromkeys(k for row in data for k in row))
+
+    # Stringify every cell once; widths and output both reuse the grid
+    names = [str(k) for k in keys]
+    cells = [[str(row.get(k, "")) for k in keys] for row in data]
+
+    # Calculate column widths (values are capped at 50 characters)
+    widths = [
+        max(len(name), min(50, max(len(cell) for cell in column)))
+        for name, column in zip(names, zip(*cells))
+    ]
+
+    # One format template per table; the precision pads and truncates each cell
+    row_fmt = " | ".join(f"{{:<{w}.{w}}}" for w in widths).format
+
+    # Build header and rows, then emit them with a single write
+    header = row_fmt(*names)
+    lines = [_color(header, COLOR_CYAN), "-" * len(header)]
+    lines.extend(row_fmt(*row_cells) for row_cells in cells)
+    lines.append("")
+    sys.stdout.write("\n".join(lines))
 
 def main() -> None:
     parser = argparse.ArgumentParser(description="OpenObserve SQL Shell")
-    parser.add_argument("--hours", type=int, default=24, help="Lookback window in hours (default: 24)")
-    parser.add_argument("--size", type=int, default=100, help="Maximum results to return (default: 100)")
+    parser.add_argument("--hours", type=positive_int, default=24, help="Lookback window in hours (default: 24)")
+    parser.add_argument("--size", type=positive_int, default=100, help="Maximum results to return (default: 100)")
     args = parser.parse_args()
 
     try:
@@ -75,14 +94,9 @@ def main() -> None:
         print("Please set ZO_BASE_URL, ZO_ORG, and ZO_ACCESS_KEY (or ZO_ROOT_USER_EMAIL/PASSWORD).")
         sys.exit(1)
 
-    # Setup readline history
-    history_file = os.path.expanduser("~/.openobserve_sql_history")
-    try:
-        readline.read_history_file(history_file)
-    except FileNotFoundError:
-        pass
-    
-    atexit.register(readline.write_history_file, history_file)
+    # Setup readline history, saved after every line so a crash loses nothing
+    flush_history = _setup_history(os.path.expanduser("~/.openobserve_sql_history"))
+    atexit.register(flush_history)
 
     print(f"Connected to {_color(client.base_url, COLOR_CYAN)} (Org: {_color(client.org, COLOR_CYAN)})")
     print(f"Time window: last {_color(str(args.hours) + ' hours', COLOR_YELLOW)}. (Use --hours to change)")
@@ -94,6 +108,7 @@ def main() -> None:
         try:
             prompt = "sql> " if not buffer else ".. > "
             line = input(prompt).strip()
+            flush_history()
         except EOFError:
             print()
             break
@@ -136,7 +151,7 @@ def main() -> None:
                 stream = parts[1]
                 try:
                     res = client.get(f"api/{client.org}/{stream}/schema")
-                    print(json.dumps(res, indent=2))
+                    print(dumps(res, indent=True))
                 except Exception as e:
                     print(f"{_color(f'Error getting schema for {stream}:', COLOR_MAGENTA)} {e}")
                 continue
@@ -150,18 +165,18 @@ def main() -> None:
 
         # Execute SQL
         try:
-            now = int(time.time() * 1_000_000)
+            now = time.time_ns() // 1000
             start_micros = now - args.hours * 60 * 60 * 1_000_000
             end_micros = now + 60 * 60 * 1_000_000
             
-            start_exec = time.time()
+            start_exec = time.perf_counter()
             result = client.search(
                 sql=sql_query,
                 start_time_micros=start_micros,
                 end_time_micros=end_micros,
                 size=args.size
             )
-            elapsed = time.time() - start_exec
+            elapsed = time.perf_counter() - start_exec
             
             hits = result.get('hits', [])
             print_table(hits)
@@ -1,20 +1,13 @@
 #!/usr/bin/env python3
 import argparse
-import json
-import sys
-from pathlib import Path
 
-# Add src directory to path to import oo_client (src layout)
-ROOT = Path(__file__).resolve().parents[1]
-SRC = ROOT / "src"
-sys.path.insert(0, str(SRC))
-
-from mcp_server_openobserve.oo_client import OpenObserveClient
+from mcp_server_openobserve.oo_client import OpenObserveClient, positive_int
+from mcp_server_openobserve.jsonutil import dumps
 
 def main():
     parser = argparse.ArgumentParser(description="Search logs in a stream")
     parser.add_argument("--stream", default="sample_logs", help="Stream name (default: sample_logs)")
-    parser.add_argument("--limit", type=int, default=10, help="Number of records to return (default: 10)")
+    parser.add_argument("--limit", type=positive_int, default=10, help="Number of records to return (default: 10)")
     parser.add_argument("--sql", help="Full SQL query (overrides stream and limit)")
     
     args = parser.parse_args()
@@ -29,13 +22,13 @@ def main():
     print(f"Executing SQL: {sql}")
     
     try:
-        response = client.search(sql=sql)
-        hits = response.get('hits', [])
-        print(f"Found {len(hits)} records.")
-        
-        for hit in hits:
-            print(json.dumps(hit, indent=2))
-            
+        # Hits are printed as they are parsed rather than after the whole response
+        count = 0
+        for hit in client.iter_hits(sql=sql):
+            print(dumps(hit, indent=True))
+            count += 1
+        print(f"Found {count} records.")
+
     except Exception as e:
         print(f"Error searching data: {e}")
 
@@ -1,15 +1,179 @@
 from __future__ import annotations
 
+import email.utils
 import logging
+import math
 import os
-from typing import Any
+import random
+import re
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, TypeVar
 
 import requests
+from requests.adapters import HTTPAdapter
 from requests.exceptions import ConnectionError as RequestsConnectionError
 from requests.exceptions import RequestException, Timeout
+from urllib3.exceptions import HTTPError as Urllib3HTTPError
+from urllib3.exceptions import ReadTimeoutError
+
+from .jsonutil import dumps_bytes, loads
+
+try:
+    import ijson
+except ImportError:  # pragma: no cover - optional speedup
+    ijson = None  # type: ignore[assignment]
 
 logger = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+
+# What reading a streamed body can raise: a stalled or cut-off connection, or
+# a body that is not (complete) JSON
+_BODY_ERRORS: tuple[type[Exception], ...] = (
+    RequestException,
+    Urllib3HTTPError,
+    OSError,
+    ValueError,
+) + ((ijson.JSONError,) if ijson is not None else ())
+
+
+# Transient statuses retried with backoff; 401/403/404 are never retried
+RETRY_STATUSES = (429, 502, 503, 504)
+_MAX_RETRIES = 3
+_BACKOFF_FACTOR = 0.5
+_BACKOFF_JITTER = 0.5
+
+
+def _pooled_adapter(max_inflight: int) -> HTTPAdapter:
+    """Build a pooled adapter without retries of its own.
+
+    ``OpenObserveClient._send`` retries instead, so that backoff sleeps and
+    ``Retry-After`` waits come out of the caller's deadline. The pool keeps a
+    connection per bulkhead slot; a smaller pool would discard connections
+    ("Connection pool is full") under exactly the load the bulkhead allows.
+    """
+    return HTTPAdapter(max_retries=0, pool_connections=10, pool_maxsize=max_inflight)
+
+
+def _retry_after(response: requests.Response) -> float | None:
+    """Seconds asked for by a ``Retry-After`` header (delta-seconds or HTTP date)."""
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, when.timestamp() - time.time())
+
+
+# A LIMIT (optionally with OFFSET) ending the statement; LIMITs inside
+# subqueries don't bound the response and are ignored
+_TRAILING_LIMIT_RE = re.compile(
+    r"\bLIMIT\s+(\d+)(?:\s+OFFSET\s+\d+)?\s*;?\s*$", re.IGNORECASE
+)
+
+
+def _sql_limit(sql: str) -> int:
+    """Row count a trailing ``LIMIT`` in ``sql`` asks for, or 0 if there is none."""
+    match = _TRAILING_LIMIT_RE.search(sql)
+    return int(match.group(1)) if match else 0
+
+
+_CONTAINER_START = frozenset({"start_map", "start_array"})
+_CONTAINER_END = frozenset({"end_map", "end_array"})
+
+
+def _is_read_timeout(error: RequestsConnectionError) -> bool:
+    """True if requests reported a read timeout as a ConnectionError."""
+    # Raised as ConnectionError(ReadTimeoutError) while streaming a body, or as
+    # ConnectionError(MaxRetryError(reason=ReadTimeoutError)) from the adapter
+    cause = error.args[0] if error.args else None
+    return isinstance(cause, ReadTimeoutError) or isinstance(
+        getattr(cause, "reason", None), ReadTimeoutError
+    )
+
+
+def _read_search_response(raw: Any, max_hits: int) -> dict[str, Any]:
+    """Incrementally parse a ``/_search`` response body, keeping at most ``max_hits`` hits.
+
+    Hits past the limit are scanned but never materialized. The body is still
+    read to the end, so top-level fields that follow ``hits`` (``total``,
+    ``took``, ...) are kept.
+    """
+    result: dict[str, Any] = {}
+    hits: list[Any] = []
+    key: str | None = None
+    in_hits = False
+    keep = True
+    builder: Any = None
+    depth = 0  # nesting of the value being read; 0 between values
+
+    def store(value: Any) -> None:
+        if in_hits:
+            hits.append(value)
+        else:
+            result[key] = value
+
+    for prefix, event, value in ijson.parse(raw, use_float=True):
+        if depth:
+            if keep:
+                builder.event(event, value)
+            if event in _CONTAINER_START:
+                depth += 1
+            elif event in _CONTAINER_END:
+                depth -= 1
+                if not depth and keep:
+                    store(builder.value)
+            continue
+
+        if not prefix:
+            if event == "map_key":
+                key = value
+            continue
+
+        if prefix == "hits" and event == "start_array":
+            in_hits = True
+            result["hits"] = hits
+            continue
+        if in_hits and prefix == "hits" and event == "end_array":
+            in_hits = False
+            continue
+
+        # Start of a top-level value or of a single hit
+        keep = not in_hits or len(hits) < max_hits
+        if event in _CONTAINER_START:
+            depth = 1
+            if keep:
+                builder = ijson.ObjectBuilder()
+                builder.event(event, value)
+        elif keep:
+            store(value)
+
+    return result
+
+
+class _DeadlineReader:
+    """Read-only file wrapper that stops a streamed body once ``deadline`` has passed."""
+
+    def __init__(self, raw: Any, deadline: float | None) -> None:
+        self._raw = raw
+        self._deadline = deadline
+
+    def read(self, size: int = -1) -> bytes:
+        if self._deadline is not None and time.monotonic() >= self._deadline:
+            raise OpenObserveConnectionError(
+                "Deadline exceeded while reading the response from OpenObserve. "
+                "Consider increasing ZO_TIMEOUT or lowering the result size."
+            )
+        return self._raw.read(size)
+
 
 class OpenObserveError(Exception):
     """Base exception for OpenObserve client errors."""
@@ -46,6 +210,120 @@ class APIError(OpenObserveError):
         self.response_text = response_text
 
 
+class CircuitBreaker:
+    """Fail fast while OpenObserve is unreachable.
+
+    The breaker is CLOSED normally. ``failure_threshold`` failures within
+    ``window_s`` seconds trip it OPEN, rejecting calls without network I/O for
+    ``recovery_s`` seconds. After that it is HALF_OPEN: a single probe request
+    is let through, and its outcome either closes the breaker or re-opens it.
+    """
+
+    def __init__(
+        self, failure_threshold: int = 5, window_s: float = 30.0, recovery_s: float = 15.0
+    ) -> None:
+        self.failure_threshold = failure_threshold
+        self.window_s = window_s
+        self.recovery_s = recovery_s
+        self._failures: deque[float] = deque()
+        self._opened_at: float | None = None
+        self._probing = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        """``"closed"``, ``"open"`` or ``"half_open"`` (recovery period over)."""
+        with self._lock:
+            if self._opened_at is None:
+                return "closed"
+            if time.monotonic() - self._opened_at < self.recovery_s:
+                return "open"
+            return "half_open"
+
+    def retry_after(self) -> float:
+        """Seconds until an open breaker lets a probe through (0 if not open)."""
+        with self._lock:
+            if self._opened_at is None:
+                return 0.0
+            return max(0.0, self.recovery_s - (time.monotonic() - self._opened_at))
+
+    def allow(self) -> bool:
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            if self._probing or time.monotonic() - self._opened_at < self.recovery_s:
+                return False
+            self._probing = True
+            return True
+
+    def release(self) -> None:
+        """End a half-open probe without an outcome, so the next call can probe."""
+        with self._lock:
+            self._probing = False
+
+    def on_success(self) -> None:
+        with self._lock:
+            self._failures.clear()
+            self._opened_at = None
+            self._probing = False
+
+    def on_failure(self) -> None:
+        now = time.monotonic()
+        with self._lock:
+            if self._opened_at is not None:
+                # Failed half-open probe: stay open for another recovery period
+                self._opened_at = now
+                self._probing = False
+                return
+            self._failures.append(now)
+            while self._failures and now - self._failures[0] > self.window_s:
+                self._failures.popleft()
+            if len(self._failures) >= self.failure_threshold:
+                self._opened_at = now
+                self._failures.clear()
+                logger.warning(
+                    "Circuit breaker opened after %d failures in %.0fs; failing fast for %.0fs",
+                    self.failure_threshold,
+                    self.window_s,
+                    self.recovery_s,
+                )
+
+
+class TTLCache:
+    """Small thread-safe cache whose entries expire ``ttl_s`` seconds after insert.
+
+    When full, the oldest entry is evicted. A ``ttl_s`` of 0
+    disables caching.
+    """
+
+    def __init__(self, maxsize: int = 256, ttl_s: float = 60.0) -> None:
+        self.maxsize = maxsize
+        self.ttl_s = ttl_s
+        self._entries: dict[Any, tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Any) -> Any | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if time.monotonic() >= expires_at:
+                del self._entries[key]
+                return None
+            return value
+
+    def set(self, key: Any, value: Any) -> None:
+        if self.ttl_s <= 0:
+            return
+        with self._lock:
+            if key not in self._entries and len(self._entries) >= self.maxsize:
+                # Insertion order == expiry order, so the first entry is the oldest
+                del self._entries[next(iter(self._entries))]
+            self._entries.pop(key, None)
+            self._entries[key] = (time.monotonic() + self.ttl_s, value)
+
+
 class OpenObserveClient:
     def __init__(
         self,
@@ -55,6 +333,8 @@ class OpenObserveClient:
         password: str | None = None,
         access_key: str | None = None,
         timeout_s: int = 30,
+        max_inflight: int = 10,
+        meta_ttl_s: float | None = None,
     ) -> None:
         self.base_url = (base_url or os.getenv("ZO_BASE_URL", "http://127.0.0.1:5080")).rstrip("/")
         self.org = org or os.getenv("ZO_ORG", "default")
@@ -62,6 +342,10 @@ class OpenObserveClient:
         self.password = password or os.getenv("ZO_ROOT_USER_PASSWORD")
         self.access_key = access_key or os.getenv("ZO_ACCESS_KEY")
         self.timeout_s = timeout_s
+        self.max_inflight = max_inflight
+        self.meta_ttl_s = (
+            meta_ttl_s if meta_ttl_s is not None else float(os.getenv("ZO_META_TTL", "60"))
+        )
 
         # Validate configuration
         if not self.base_url:
@@ -78,11 +362,37 @@ class OpenObserveClient:
         if timeout_s <= 0:
             raise ConfigurationError(f"timeout_s must be positive, got {timeout_s}")
 
+        if max_inflight <= 0:
+            raise ConfigurationError(f"max_inflight must be positive, got {max_inflight}")
+
+        if self.meta_ttl_s < 0:
+            raise ConfigurationError(f"meta_ttl_s must be >= 0, got {self.meta_ttl_s}")
+
+        self._base = f"{self.base_url}/"
+
+        # One pooled session for the life of the client so back-to-back tool
+        # calls reuse TCP/TLS connections instead of reconnecting every time
+        self._session = requests.Session()
+        self._session.headers.update(self._auth_headers())
+        if not self.access_key:
+            self._session.auth = (self.email, self.password)
+        adapter = _pooled_adapter(max_inflight)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+        self._breaker = CircuitBreaker()
+        # Bulkhead: cap concurrent requests so a burst of tool calls cannot
+        # exhaust the pool or pile up on a struggling OpenObserve
+        self._inflight = threading.BoundedSemaphore(max_inflight)
+        # Stream list and schemas change rarely; keep the raw response bodies
+        # for a short while so exploratory tool calls skip the round-trip
+        self._meta_cache = TTLCache(maxsize=256, ttl_s=self.meta_ttl_s)
+
         logger.debug(
-            "OpenObserveClient initialized: base_url=%s, org=%s, timeout=%ds",
+            "OpenObserveClient initialized: base_url=%s, org=%s, timeout=%ds, max_inflight=%d",
             self.base_url,
             self.org,
             self.timeout_s,
+            self.max_inflight,
         )
 
     def _auth_headers(self) -> dict[str, str]:
@@ -91,56 +401,220 @@ class OpenObserveClient:
             headers["Authorization"] = f"Basic {self.access_key}"
         return headers
 
-    def _request(self, method: str, path: str, **kwargs: Any) -> requests.Response:
-        url = f"{self.base_url}/{path.lstrip('/')}"
+    def warm_up(self) -> None:
+        """Open a pooled keep-alive connection ahead of the first real request.
+
+        Failures are only logged; the first real request will report them.
+        """
+        try:
+            self._session.get(self._base + "healthz", timeout=self.timeout_s).close()
+        except RequestException as e:
+            logger.debug("Connection warm-up to %s failed: %s", self.base_url, e)
+        else:
+            logger.debug("Connection warm-up to %s done", self.base_url)
+
+    def close(self) -> None:
+        """Close pooled HTTP connections."""
+        self._session.close()
+
+    def __enter__(self) -> OpenObserveClient:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def _time_left(self, deadline: float | None, method: str, url: str) -> float:
+        """Timeout for the next blocking step: ``timeout_s``, capped by ``deadline``."""
+        if deadline is None:
+            return float(self.timeout_s)
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            logger.error("Deadline exceeded before sending: %s %s", method, url)
+            raise OpenObserveConnectionError(
+                "Deadline exceeded before the request to OpenObserve could be sent. "
+                "Consider increasing ZO_TIMEOUT or lowering concurrency."
+            )
+        return max(0.05, min(float(self.timeout_s), remaining))
+
+    def _breaker_open(self, method: str, url: str) -> OpenObserveConnectionError:
+        # "half_open" here means another call's probe is still in flight
+        logger.error(
+            "Circuit breaker %s, skipping request: %s %s", self._breaker.state, method, url
+        )
+        wait = self._breaker.retry_after()
+        if wait > 0:
+            return OpenObserveConnectionError(
+                f"OpenObserve at {self.base_url} is failing repeatedly; not sending requests "
+                f"for another {math.ceil(wait)}s."
+            )
+        return OpenObserveConnectionError(
+            f"OpenObserve at {self.base_url} has been failing; a recovery probe is in "
+            "progress. Retry shortly."
+        )
+
+    def _retry_delay(
+        self, attempt: int, deadline: float | None, response: requests.Response | None = None
+    ) -> float | None:
+        """Seconds to sleep before retrying after failed ``attempt`` (0-based), or None.
+
+        None means give up: retries are used up, or the sleep would not leave
+        room for another attempt before ``deadline``.
+        """
+        if attempt >= _MAX_RETRIES:
+            return None
+        delay = _retry_after(response) if response is not None else None
+        if delay is None:
+            # Same schedule as urllib3's Retry: immediate, then exponential
+            delay = 0.0
+            if attempt:
+                delay = _BACKOFF_FACTOR * 2**attempt + random.uniform(0, _BACKOFF_JITTER)
+        if deadline is not None and time.monotonic() + delay >= deadline:
+            return None
+        return delay
+
+    def _send(
+        self, method: str, url: str, deadline: float | None, **kwargs: Any
+    ) -> requests.Response:
+        """Send a request, retrying connection failures and ``RETRY_STATUSES``.
+
+        Every POST this client makes is a read-only search, so POST is retried
+        too. Read timeouts are not: a query that timed out once would only load
+        an overloaded OpenObserve again. Each attempt's timeout and each sleep
+        between attempts come out of ``deadline``. When retries run out, the last
+        response is returned so ``_request`` can map its status.
+        """
+        attempt = 0
+        while True:
+            timeout = self._time_left(deadline, method, url)
+            try:
+                response = self._session.request(method, url, timeout=timeout, **kwargs)
+            except RequestsConnectionError as e:
+                delay = None if _is_read_timeout(e) else self._retry_delay(attempt, deadline)
+                if delay is None:
+                    raise self._transport_error(e, timeout, method, url) from e
+                logger.warning("Connection failed, retrying in %.1fs: %s %s", delay, method, url)
+            except RequestException as e:
+                raise self._transport_error(e, timeout, method, url) from e
+            else:
+                if response.status_code not in RETRY_STATUSES:
+                    return response
+                delay = self._retry_delay(attempt, deadline, response)
+                if delay is None:
+                    return response
+                logger.warning(
+                    "HTTP %d, retrying in %.1fs: %s %s", response.status_code, delay, method, url
+                )
+                response.close()
+            time.sleep(delay)
+            attempt += 1
+
+    def _transport_error(
+        self, error: RequestException, timeout: float, method: str, url: str
+    ) -> OpenObserveConnectionError:
+        if isinstance(error, Timeout) or (
+            isinstance(error, RequestsConnectionError) and _is_read_timeout(error)
+        ):
+            logger.error("Request timeout after %.1fs: %s %s", timeout, method, url)
+            return OpenObserveConnectionError(
+                f"Request to OpenObserve timed out after {timeout:.1f}s. "
+                "Consider increasing ZO_TIMEOUT or check network connectivity."
+            )
+        if isinstance(error, RequestsConnectionError):
+            logger.error("Connection error: %s %s - %s", method, url, error)
+            return OpenObserveConnectionError(
+                f"Failed to connect to OpenObserve at {self.base_url}. "
+                "Verify the URL and that OpenObserve is running."
+            )
+        logger.error("Request error: %s %s - %s", method, url, error)
+        return OpenObserveConnectionError(f"Request failed: {error}")
+
+    def _request(
+        self,
+        method: str,
+        path: str,
+        deadline: float | None = None,
+        read_body: Callable[[Any], Any] | None = None,
+        **kwargs: Any,
+    ) -> Any:
+        """Send one request and return the response.
+
+        ``deadline`` (a ``time.monotonic()`` value) bounds the whole call: the
+        bulkhead wait, every attempt and the backoff between them. With
+        ``read_body`` the response is streamed and ``read_body(raw)`` is returned
+        instead; the bulkhead slot and deadline then also cover reading the body.
+        """
+        url = self._base + path.lstrip("/")
         params = kwargs.get("params")
         json_body = kwargs.get("json")
 
-        # Log request with SQL if present
-        if (
-            isinstance(json_body, dict)
-            and "query" in json_body
-            and isinstance(json_body["query"], dict)
-        ):
-            query = json_body["query"]
-            sql = query.get("sql")
+        # Log request with SQL if present (skip the body inspection entirely
+        # when INFO is disabled)
+        if logger.isEnabledFor(logging.INFO):
+            query = json_body.get("query") if isinstance(json_body, dict) else None
+            sql = query.get("sql") if isinstance(query, dict) else None
             if sql is not None:
                 logger.info("OpenObserve request: %s %s sql=%s params=%s", method, url, sql, params)
             else:
                 logger.info("OpenObserve request: %s %s params=%s", method, url, params)
-        else:
-            logger.info("OpenObserve request: %s %s params=%s", method, url, params)
 
         logger.debug("Request details: url=%s, timeout=%ds", url, self.timeout_s)
 
-        headers = dict(self._auth_headers())
-        headers.update(kwargs.pop("headers", {}))
-        auth = None if self.access_key else (self.email, self.password)
-
-        try:
-            response = requests.request(
+        # Encode JSON bodies ourselves (orjson when available); the session
+        # already sends Content-Type: application/json
+        if json_body is not None:
+            kwargs["data"] = dumps_bytes(kwargs.pop("json"))
+        if read_body is not None:
+            kwargs["stream"] = True
+
+        # Fail fast while the breaker is open instead of queueing for a slot
+        if self._breaker.retry_after() > 0:
+            raise self._breaker_open(method, url)
+
+        # Take a bulkhead slot and the time budget before asking the breaker:
+        # once allow() has granted a half-open probe, every exit has to report
+        # back to it or the breaker keeps waiting on a probe that never ran
+        wait = self._time_left(deadline, method, url)
+        if not self._inflight.acquire(timeout=wait):
+            logger.error(
+                "Bulkhead full (%d in flight) after waiting %.1fs: %s %s",
+                self.max_inflight,
+                wait,
                 method,
                 url,
-                headers=headers,
-                auth=auth,
-                timeout=self.timeout_s,
-                **kwargs,
             )
-        except Timeout as e:
-            logger.error("Request timeout after %ds: %s %s", self.timeout_s, method, url)
-            raise OpenObserveConnectionError(
-                f"Request to OpenObserve timed out after {self.timeout_s}s. "
-                "Consider increasing ZO_TIMEOUT or check network connectivity."
-            ) from e
-        except RequestsConnectionError as e:
-            logger.error("Connection error: %s %s - %s", method, url, e)
             raise OpenObserveConnectionError(
-                f"Failed to connect to OpenObserve at {self.base_url}. "
-                "Verify the URL and that OpenObserve is running."
-            ) from e
-        except RequestException as e:
-            logger.error("Request error: %s %s - %s", method, url, e)
-            raise OpenObserveConnectionError(f"Request failed: {e}") from e
+                f"Too many concurrent OpenObserve requests (limit {self.max_inflight}); "
+                f"no slot freed up within {wait:.1f}s. Consider raising ZO_MAX_INFLIGHT."
+            )
+
+        try:
+            self._time_left(deadline, method, url)  # raises if queueing used up the budget
+            if not self._breaker.allow():
+                raise self._breaker_open(method, url)
+            try:
+                response = self._send(method, url, deadline, **kwargs)
+            except OpenObserveConnectionError:
+                self._breaker.on_failure()
+                raise
+            except BaseException:
+                # No verdict on OpenObserve (e.g. interrupted); free the probe
+                self._breaker.release()
+                raise
+            self._check_status(response, method, url, path)
+            if read_body is None:
+                return response
+            with response:
+                return self._read_body(response, read_body, deadline, method, url)
+        finally:
+            self._inflight.release()
+
+    def _check_status(self, response: requests.Response, method: str, url: str, path: str) -> None:
+        """Report the response to the breaker and raise for HTTP error statuses."""
+        # 5xx means OpenObserve itself is unhealthy; anything else proves it is up
+        if response.status_code >= 500:
+            self._breaker.on_failure()
+        else:
+            self._breaker.on_success()
 
         # Handle HTTP errors
         if not response.ok:
@@ -181,7 +655,36 @@ class OpenObserveClient:
                 )
 
         logger.debug("Request successful: %s %s -> HTTP %d", method, url, response.status_code)
-        return response
+
+    def _read_body(
+        self,
+        response: requests.Response,
+        read_body: Callable[[Any], _T],
+        deadline: float | None,
+        method: str,
+        url: str,
+    ) -> _T:
+        """Run ``read_body`` over a streamed response body, still bounded by ``deadline``."""
+        response.raw.decode_content = True
+        try:
+            return read_body(_DeadlineReader(response.raw, deadline))
+        except OpenObserveConnectionError:
+            self._breaker.on_failure()
+            raise
+        except _BODY_ERRORS as e:
+            self._breaker.on_failure()
+            if isinstance(e, ReadTimeoutError) or (
+                isinstance(e, RequestsConnectionError) and _is_read_timeout(e)
+            ):
+                logger.error("Response read timed out: %s %s", method, url)
+                raise OpenObserveConnectionError(
+                    "Reading the response from OpenObserve timed out. "
+                    "Consider increasing ZO_TIMEOUT or check network connectivity."
+                ) from e
+            logger.error("Failed reading response: %s %s - %s", method, url, e)
+            raise OpenObserveConnectionError(
+                f"Failed to read the response from OpenObserve: {e}"
+            ) from e
 
     def search(
         self,
@@ -190,6 +693,7 @@ class OpenObserveClient:
         end_time_micros: int,
         size: int,
         offset: int,
+        deadline: float | None = None,
     ) -> dict[str, Any]:
         payload = {
             "query": {
@@ -200,13 +704,46 @@ class OpenObserveClient:
                 "end_time": end_time_micros,
             }
         }
-        return self._request("POST", f"api/{self.org}/_search", json=payload).json()
+        path = f"api/{self.org}/_search"
+
+        # A LIMIT in the SQL takes precedence over "size" on the server, so cap
+        # the hits here too. Only when that LIMIT asks for more than ``size``
+        # can the response be much bigger than what we keep; then (with ijson)
+        # the body is parsed as it streams in and surplus hits are never built.
+        # Otherwise a one-shot loads() is several times faster than ijson.
+        if ijson is not None and _sql_limit(sql) > size:
+            return self._request(
+                "POST",
+                path,
+                deadline=deadline,
+                read_body=lambda raw: _read_search_response(raw, size),
+                json=payload,
+            )
+
+        result = loads(self._request("POST", path, deadline=deadline, json=payload).content)
+        hits = result.get("hits") if isinstance(result, dict) else None
+        if isinstance(hits, list) and len(hits) > size:
+            result["hits"] = hits[:size]
+        return result
+
+    def _get_cached(self, path: str, deadline: float | None = None) -> Any:
+        # Cache bytes rather than the parsed object so callers can't mutate
+        # what the next caller gets back
+        content = self._meta_cache.get(path)
+        if content is None:
+            content = self._request("GET", path, deadline=deadline).content
+            self._meta_cache.set(path, content)
+        else:
+            logger.debug("Metadata cache hit: %s", path)
+        return loads(content)
 
-    def list_streams(self) -> Any:
-        return self._request("GET", f"api/{self.org}/streams").json()
+    def list_streams(self, deadline: float | None = None) -> Any:
+        return self._get_cached(f"api/{self.org}/streams", deadline)
 
-    def get_stream_schema(self, stream: str) -> dict[str, Any]:
-        return self._request("GET", f"api/{self.org}/streams/{stream}/schema").json()
+    def get_stream_schema(self, stream: str, deadline: float | None = None) -> dict[str, Any]:
+        return self._get_cached(f"api/{self.org}/streams/{stream}/schema", deadline)
 
-    def get(self, path: str, params: dict[str, Any] | None = None) -> Any:
-        return self._request("GET", path, params=params).json()
+    def get(
+        self, path: str, params: dict[str, Any] | None = None, deadline: float | None = None
+    ) -> Any:
+        return loads(self._request("GET", path, deadline=deadline, params=params).content)
@@ -0,0 +1,116 @@
+"""JSON encode/decode helpers that use orjson when it is installed.
+
+orjson is an optional speedup (``pip install mcp-server-openobserve[speedups]``);
+without it these fall back to the stdlib ``json`` module.
+"""
+
+from __future__ import annotations
+
+import functools
+import json
+from typing import Any, Callable, Iterable, Iterator
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None  # type: ignore[assignment]
+
+HAVE_ORJSON = orjson is not None
+
+
+def dumps(
+    obj: Any, *, indent: bool = False, default: Callable[[Any], Any] | None = None
+) -> str:
+    """Serialize ``obj`` to a JSON string, optionally indented by two spaces.
+
+    ``default`` converts objects JSON cannot represent, as in :func:`json.dumps`.
+    """
+    if orjson is not None:
+        # Non-str keys are stringified like the stdlib does instead of raising
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        try:
+            return orjson.dumps(obj, default=default, option=option).decode("utf-8")
+        except orjson.JSONEncodeError:
+            # e.g. integers beyond 64 bits; stdlib copes
+            pass
+    return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False, default=default)
+
+
+# Lists longer than this are encoded a slice at a time by _pieces, so
+# dumps_prefix can stop early on huge results while small ones stay one call
+_PREFIX_SLICE = 256
+
+
+def _pieces(
+    obj: Any, encode: Callable[[Any], str], item_sep: str, key_sep: str
+) -> Iterator[str]:
+    """Yield the one-shot ``encode(obj)`` output in order, in several pieces.
+
+    Dicts with str keys are walked item by item and long lists slice by slice;
+    everything else is a single ``encode`` call. ``item_sep``/``key_sep`` must be
+    the separators ``encode`` itself uses, so the joined pieces equal
+    ``encode(obj)``.
+    """
+    if isinstance(obj, list) and len(obj) > _PREFIX_SLICE:
+        yield "["
+        for i in range(0, len(obj), _PREFIX_SLICE):
+            if i:
+                yield item_sep
+            yield encode(obj[i : i + _PREFIX_SLICE])[1:-1]
+        yield "]"
+    elif isinstance(obj, dict) and obj and all(type(key) is str for key in obj):
+        separator = "{"
+        for key, value in obj.items():
+            yield separator + encode(key) + key_sep
+            yield from _pieces(value, encode, item_sep, key_sep)
+            separator = item_sep
+        yield "}"
+    else:
+        yield encode(obj)
+
+
+def dumps_prefix(obj: Any, limit: int, *, default: Callable[[Any], Any] | None = None) -> str:
+    """Return the JSON encoding of ``obj``, cut off once it exceeds ``limit`` characters.
+
+    The result is the full encoding if it fits, otherwise a prefix longer than
+    ``limit``, so ``len(result) > limit`` tells whether the value was too big.
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+
+        def encode(value: Any) -> str:
+            return orjson.dumps(value, default=default, option=option).decode("utf-8")
+
+        try:
+            return _join_until(_pieces(obj, encode, ",", ":"), limit)
+        except orjson.JSONEncodeError:
+            pass  # e.g. integers beyond 64 bits; the stdlib path below copes
+    # Same slicing with the C-accelerated json.dumps; iterencode would stop
+    # early too but runs the much slower pure-Python encoder
+    encode = functools.partial(json.dumps, ensure_ascii=False, default=default)
+    return _join_until(_pieces(obj, encode, ", ", ": "), limit)
+
+
+def _join_until(chunks: Iterable[str], limit: int) -> str:
+    parts: list[str] = []
+    size = 0
+    for chunk in chunks:
+        parts.append(chunk)
+        size += len(chunk)
+        if size > limit:
+            break
+    return "".join(parts)
+
+
+def dumps_bytes(obj: Any) -> bytes:
+    """Serialize ``obj`` to compact UTF-8 JSON bytes, e.g. for a request body."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def loads(data: bytes | str) -> Any:
+    """Deserialize a JSON document; accepts the raw bytes of a response body."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -4,13 +4,12 @@ import argparse
 import logging
 import os
 import sys
+import threading
 from urllib.parse import urlparse
 
 from dotenv import load_dotenv
-from fastmcp.server.auth.providers.jwt import StaticTokenVerifier
 
 from .client import ConfigurationError, OpenObserveClient
-from .server import create_mcp_server, setup_logging
 
 logger = logging.getLogger(__name__)
 
@@ -42,14 +41,8 @@ def validate_positive_int(value: int, name: str, min_val: int = 1) -> int:
     return value
 
 
-def main() -> None:
-    # Load environment variables from .env file
-    load_dotenv()
-
-    # Set up logging early so validation errors are logged
-    log_level = os.getenv("MCP_LOG_LEVEL", "INFO").upper()
-    setup_logging(log_level)
-
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the CLI parser; defaults come from the environment (.env already loaded)."""
     parser = argparse.ArgumentParser(description="OpenObserve MCP server (read/query only)")
     parser.add_argument(
         "--transport",
@@ -66,14 +59,32 @@ def main() -> None:
     parser.add_argument("--password", default=os.getenv("ZO_ROOT_USER_PASSWORD"))
     parser.add_argument("--access-key", default=os.getenv("ZO_ACCESS_KEY"))
     parser.add_argument("--timeout", type=int, default=int(os.getenv("ZO_TIMEOUT", "30")))
+    parser.add_argument(
+        "--max-inflight", type=int, default=int(os.getenv("ZO_MAX_INFLIGHT", "10"))
+    )
+    parser.add_argument("--meta-ttl", type=int, default=int(os.getenv("ZO_META_TTL", "60")))
 
     parser.add_argument("--max-rows", type=int, default=int(os.getenv("MCP_MAX_ROWS", "1000")))
     parser.add_argument("--max-chars", type=int, default=int(os.getenv("MCP_MAX_CHARS", "50000")))
 
     parser.add_argument("--auth-token", default=os.getenv("OPENOBSERVE_MCP_AUTH_TOKEN"))
     parser.add_argument("--auth-disabled", action="store_true", default=False)
+    return parser
 
-    args = parser.parse_args()
+
+def main() -> None:
+    # Load environment variables from .env file
+    load_dotenv()
+
+    # Parse before importing fastmcp (via .server) so --help and argument
+    # errors return without paying for that import
+    args = _build_parser().parse_args()
+
+    from .server import create_mcp_server, setup_logging
+
+    # Set up logging early so validation errors are logged
+    log_level = os.getenv("MCP_LOG_LEVEL", "INFO").upper()
+    setup_logging(log_level)
 
     # Validate configuration
     try:
@@ -107,6 +118,8 @@ def main() -> None:
 
         # Validate timeout and limits
         args.timeout = validate_positive_int(args.timeout, "timeout", min_val=1)
+        args.max_inflight = validate_positive_int(args.max_inflight, "max-inflight", min_val=1)
+        args.meta_ttl = validate_positive_int(args.meta_ttl, "meta-ttl", min_val=0)
         args.max_rows = validate_positive_int(args.max_rows, "max-rows", min_val=1)
         args.max_chars = validate_positive_int(args.max_chars, "max-chars", min_val=100)
 
@@ -141,6 +154,8 @@ def main() -> None:
                     "Set OPENOBSERVE_MCP_AUTH_TOKEN or use --auth-disabled (local/dev only)"
                 )
                 sys.exit(1)
+            from fastmcp.server.auth.providers.jwt import StaticTokenVerifier
+
             auth_provider = StaticTokenVerifier(
                 tokens={args.auth_token: {"client_id": "mcp-client", "scopes": []}},
                 required_scopes=[],
@@ -157,8 +172,13 @@ def main() -> None:
             password=args.password,
             access_key=args.access_key,
             timeout_s=args.timeout,
+            max_inflight=args.max_inflight,
+            meta_ttl_s=args.meta_ttl,
         )
         logger.info("OpenObserve client initialized successfully")
+        # Connect in the background so the first tool call skips the TCP/TLS
+        # handshake without delaying startup if OpenObserve is slow or down
+        threading.Thread(target=client.warm_up, name="openobserve-warm-up", daemon=True).start()
     except Exception as e:
         logger.error("Failed to initialize OpenObserve client: %s", e)
         sys.exit(1)
@@ -11,13 +11,70 @@ Usage examples:
 from __future__ import annotations
 
 import argparse
+import gzip
 import json
 import os
 import sys
 import time
-from typing import Any, Iterable
+import zlib
+from typing import Any, Iterable, Iterator
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import ijson
+except ImportError:  # pragma: no cover - optional speedup
+    ijson = None  # type: ignore[assignment]
+
+# orjson decodes large search responses several times faster than stdlib json;
+# json.loads accepts the raw response bytes too, so both paths take .content.
+_loads = orjson.loads if orjson is not None else json.loads
+
+
+def _dumps(obj: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+
+_MICROS_PER_HOUR = 60 * 60 * 1_000_000
+_DEFAULT_LOOKBACK_MICROS = 24 * _MICROS_PER_HOUR
+
+# Batches larger than this are encoded and gzipped incrementally and uploaded
+# with chunked transfer encoding instead of being built as one body in memory
+STREAM_INGEST_THRESHOLD = 10_000
+
+
+def positive_int(value: str) -> int:
+    """argparse ``type=`` for integers >= 1; shared with the scripts/ tools."""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, got {value}")
+    return number
+
+
+def _gzip_json_array(records: list[Any], batch: int = 1000) -> Iterator[bytes]:
+    """Yield a gzip-compressed JSON array of ``records``, encoding ``batch`` at a time."""
+    compressor = zlib.compressobj(1, zlib.DEFLATED, 16 + zlib.MAX_WBITS)  # gzip container
+    pieces = [b"["]
+    for i in range(0, len(records), batch):
+        if i:
+            pieces.append(b",")
+        pieces.append(_dumps(records[i : i + batch])[1:-1])
+        # Never yield b"": requests would send it as the terminating chunk
+        out = compressor.compress(b"".join(pieces))
+        pieces.clear()
+        if out:
+            yield out
+    pieces.append(b"]")
+    yield compressor.compress(b"".join(pieces)) + compressor.flush()
 
 
 class OpenObserveClient:
@@ -44,22 +101,45 @@ class OpenObserveClient:
                 "Provide access_key or email/password via args or env vars"
             )
 
+        self._session = requests.Session()
+        self._session.headers.update(self._auth_headers())
+        if not self.access_key:
+            self._session.auth = (self.email, self.password)
+        # Connection failures are retried for every method. Status/read retries
+        # are limited to GET because ingest POSTs are not idempotent.
+        retry = Retry(
+            total=3,
+            backoff_factor=0.5,
+            backoff_jitter=0.5,
+            status_forcelist=(429, 502, 503, 504),
+            allowed_methods=frozenset({"GET"}),
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(max_retries=retry, pool_connections=10, pool_maxsize=20)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+
     def _auth_headers(self) -> dict[str, str]:
         headers = {"Content-Type": "application/json"}
         if self.access_key:
             headers["Authorization"] = f"Basic {self.access_key}"
         return headers
 
+    def close(self) -> None:
+        self._session.close()
+
+    def __enter__(self) -> OpenObserveClient:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
     def _request(self, method: str, path: str, **kwargs: Any) -> requests.Response:
         url = f"{self.base_url}/{path.lstrip('/')}"
-        headers = dict(self._auth_headers())
-        headers.update(kwargs.pop("headers", {}))
-        auth = None if self.access_key else (self.email, self.password)
-        response = requests.request(
+        response = self._session.request(
             method,
             url,
-            headers=headers,
-            auth=auth,
             timeout=self.timeout_s,
             **kwargs,
         )
@@ -67,24 +147,41 @@ class OpenObserveClient:
             raise RuntimeError(f"HTTP {response.status_code}: {response.text}")
         return response
 
-    def ingest_json(self, stream: str, records: list[dict[str, Any]]) -> dict[str, Any]:
+    def ingest_json(
+        self, stream: str, records: list[dict[str, Any]], gzip_body: bool = True
+    ) -> dict[str, Any]:
         if not isinstance(records, list):
             raise ValueError("records must be a list of objects")
         path = f"api/{self.org}/{stream}/_json"
-        return self._request("POST", path, json=records).json()
+        if gzip_body and len(records) > STREAM_INGEST_THRESHOLD:
+            return _loads(
+                self._request(
+                    "POST",
+                    path,
+                    data=_gzip_json_array(records),
+                    headers={"Content-Encoding": "gzip"},
+                ).content
+            )
+        body = _dumps(records)
+        headers = {}
+        if gzip_body:
+            # Log records are highly repetitive; level 1 is fast and still shrinks them a lot
+            body = gzip.compress(body, compresslevel=1)
+            headers["Content-Encoding"] = "gzip"
+        return _loads(self._request("POST", path, data=body, headers=headers).content)
 
-    def search(
+    def _search_payload(
         self,
         sql: str,
-        start_time_micros: int | None = None,
-        end_time_micros: int | None = None,
-        size: int = 1000,
-        offset: int = 0,
+        start_time_micros: int | None,
+        end_time_micros: int | None,
+        size: int,
+        offset: int,
     ) -> dict[str, Any]:
-        now = int(time.time() * 1_000_000)
-        start_time = start_time_micros or (now - 24 * 60 * 60 * 1_000_000)
-        end_time = end_time_micros or (now + 60 * 60 * 1_000_000)
-        payload = {
+        now = time.time_ns() // 1000
+        start_time = start_time_micros or (now - _DEFAULT_LOOKBACK_MICROS)
+        end_time = end_time_micros or (now + _MICROS_PER_HOUR)
+        return {
             "query": {
                 "sql": sql,
                 "from": offset,
@@ -93,10 +190,43 @@ class OpenObserveClient:
                 "end_time": end_time,
             }
         }
-        return self._request("POST", f"api/{self.org}/_search", json=payload).json()
+
+    def search(
+        self,
+        sql: str,
+        start_time_micros: int | None = None,
+        end_time_micros: int | None = None,
+        size: int = 1000,
+        offset: int = 0,
+    ) -> dict[str, Any]:
+        payload = self._search_payload(sql, start_time_micros, end_time_micros, size, offset)
+        return _loads(self._request("POST", f"api/{self.org}/_search", json=payload).content)
+
+    def iter_hits(
+        self,
+        sql: str,
+        start_time_micros: int | None = None,
+        end_time_micros: int | None = None,
+        size: int = 1000,
+        offset: int = 0,
+    ) -> Iterator[dict[str, Any]]:
+        """Yield search hits one at a time.
+
+        With ijson installed the response body is parsed incrementally, so memory
+        stays flat regardless of the number of hits; otherwise the whole response
+        is decoded first.
+        """
+        payload = self._search_payload(sql, start_time_micros, end_time_micros, size, offset)
+        path = f"api/{self.org}/_search"
+        if ijson is None:
+            yield from _loads(self._request("POST", path, json=payload).content).get("hits", [])
+            return
+        with self._request("POST", path, json=payload, stream=True) as response:
+            response.raw.decode_content = True
+            yield from ijson.items(response.raw, "hits.item", use_float=True)
 
     def get(self, path: str, params: dict[str, Any] | None = None) -> Any:
-        return self._request("GET", path, params=params).json()
+        return _loads(self._request("GET", path, params=params).content)
 
 
 def _load_records(path: str | None, inline_json: str | None) -> list[dict[str, Any]]:
@@ -118,9 +248,9 @@ def _load_records(path: str | None, inline_json: str | None) -> list[dict[str, A
 def _parse_kv_pairs(pairs: Iterable[str]) -> dict[str, str]:
     params: dict[str, str] = {}
     for item in pairs:
-        if "=" not in item:
+        key, sep, value = item.partition("=")
+        if not sep:
             raise ValueError(f"Expected key=value pair, got: {item}")
-        key, value = item.split("=", 1)
         params[key] = value
     return params
 
@@ -189,9 +319,9 @@ def main() -> int:
             start_micros = args.start_micros
             end_micros = args.end_micros
             if args.hours is not None:
-                now = int(time.time() * 1_000_000)
-                start_micros = now - args.hours * 60 * 60 * 1_000_000
-                end_micros = now + 60 * 60 * 1_000_000
+                now = time.time_ns() // 1000
+                start_micros = now - args.hours * _MICROS_PER_HOUR
+                end_micros = now + _MICROS_PER_HOUR
             result = client.search(
                 sql=args.sql,
                 start_time_micros=start_micros,
@@ -219,18 +349,23 @@ def main() -> int:
                 raise RuntimeError(
                     "YAML output requires PyYAML. Install with: pip install pyyaml"
                 ) from exc
-            print(
-                yaml.safe_dump(
-                    result,
-                    sort_keys=True,
-                    default_flow_style=(not args.pretty),
-                ).rstrip()
+            # Dump straight to stdout rather than building the whole document
+            # as a string first; wide search results would otherwise be held twice
+            yaml.safe_dump(
+                result,
+                sys.stdout,
+                sort_keys=True,
+                default_flow_style=(not args.pretty),
             )
         else:
             if args.pretty:
-                print(json.dumps(result, indent=2, sort_keys=True))
+                # indent= forces the pure-Python encoder either way, so stream it
+                json.dump(result, sys.stdout, indent=2, sort_keys=True)
             else:
-                print(json.dumps(result))
+                # json.dump would also drop to the pure-Python encoder; the C
+                # one-shot dumps is several times faster for the same bytes
+                sys.stdout.write(json.dumps(result))
+            sys.stdout.write("\n")
         return 0
     except Exception as exc:
         print(f"Error: {exc}", file=sys.stderr)
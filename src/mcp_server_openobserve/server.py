@@ -1,16 +1,65 @@
 from __future__ import annotations
 
-import json
+import asyncio
+import functools
+import inspect
 import logging
+import re
 import time
-from typing import Any, Iterable
+from itertools import islice
+from typing import Any, Callable, Final, Iterable, TypeVar
 
 from fastmcp import FastMCP
+from mcp.types import ToolAnnotations
 
 from .client import APIError, AuthenticationError, OpenObserveClient, OpenObserveConnectionError
+from .jsonutil import HAVE_ORJSON, dumps, dumps_prefix
 
 logger = logging.getLogger(__name__)
 
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+_CLIENT_ERRORS: Final = (APIError, AuthenticationError, OpenObserveConnectionError)
+
+_MICROS_PER_HOUR: Final = 60 * 60 * 1_000_000
+_DEFAULT_LOOKBACK_MICROS: Final = 24 * _MICROS_PER_HOUR
+
+# OpenObserve normalizes stream names to letters, digits and underscores, and
+# the name is used as an unquoted SQL identifier, so it can't start with a digit.
+# Anything else would only ever be an attempt to break out of the FROM clause.
+_STREAM_NAME_RE: Final = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+
+# search_sql only forwards single read queries. The first keyword is looked for
+# past any whitespace, comments and opening parentheses. String literals and
+# quoted identifiers (a doubled quote escapes one) and comments are blanked out
+# before looking for a ';' that starts a second statement.
+_SQL_PREAMBLE_RE: Final = re.compile(r"(?:\s+|--[^\n]*|/\*.*?\*/|\()*", re.DOTALL)
+_SQL_START_RE: Final = re.compile(r"(?:SELECT|WITH)\b", re.IGNORECASE)
+_SQL_OPAQUE_RE: Final = re.compile(
+    r"'(?:[^']|'')*'|\"(?:[^\"]|\"\")*\"|--[^\n]*|/\*.*?\*/", re.DOTALL
+)
+_SQL_NEXT_STATEMENT_RE: Final = re.compile(r";\s*\S")
+
+_URL_SCHEMES: Final = ("http://", "https://")
+
+# Truncated dict previews list at most this many top-level keys, in the order
+# OpenObserve returned them
+_MAX_PREVIEW_KEYS: Final = 128
+
+# Built once as ToolAnnotations so FastMCP uses them as-is instead of
+# converting a dict for every tool
+_READ_ONLY_ANNOTATIONS: Final = ToolAnnotations(
+    readOnlyHint=True,
+    destructiveHint=False,
+    openWorldHint=False,
+)
+
+_OPEN_WORLD_ANNOTATIONS: Final = ToolAnnotations(
+    readOnlyHint=True,
+    destructiveHint=False,
+    openWorldHint=True,
+)
+
 
 def setup_logging(level: str = "INFO") -> None:
     """Configure logging for the MCP server.
@@ -49,9 +98,9 @@ def setup_logging(level: str = "INFO") -> None:
 def _parse_kv_pairs(pairs: Iterable[str]) -> dict[str, str]:
     params: dict[str, str] = {}
     for item in pairs:
-        if "=" not in item:
+        key, sep, value = item.partition("=")
+        if not sep:
             raise ValueError(f"Expected key=value pair, got: {item}")
-        key, value = item.split("=", 1)
         params[key] = value
     return params
 
@@ -59,7 +108,17 @@ def _parse_kv_pairs(pairs: Iterable[str]) -> dict[str, str]:
 def _apply_max_chars(payload: Any, max_chars: int) -> Any:
     if max_chars <= 0:
         return payload
-    encoded = json.dumps(payload, ensure_ascii=False, default=str)
+    # Already text: measure and slice it directly rather than JSON-escaping it.
+    # Bytes are measured as-is and only the preview is decoded (a character cut
+    # in half at the end is dropped).
+    if isinstance(payload, (str, bytes, bytearray)):
+        if len(payload) <= max_chars:
+            return payload
+        preview = payload[:max_chars]
+        if not isinstance(preview, str):
+            preview = preview.decode("utf-8", "ignore")
+        return {"truncated": True, "max_chars": max_chars, "preview": preview}
+    encoded = dumps_prefix(payload, max_chars, default=str)
     if len(encoded) <= max_chars:
         return payload
     preview = encoded[:max_chars]
@@ -67,7 +126,7 @@ def _apply_max_chars(payload: Any, max_chars: int) -> Any:
         return {
             "truncated": True,
             "max_chars": max_chars,
-            "keys": sorted(payload.keys()),
+            "keys": list(islice(payload, _MAX_PREVIEW_KEYS)),
             "preview": preview,
         }
     return {
@@ -77,12 +136,76 @@ def _apply_max_chars(payload: Any, max_chars: int) -> Any:
     }
 
 
+def _serialize_tool_result(data: Any) -> str:
+    return dumps(data, default=str)
+
+
+def _log_failures(name: str) -> Callable[[_F], _F]:
+    """Log a tool's client errors (and, with a traceback, unexpected ones) and re-raise.
+
+    ValueError is argument validation and passes through unlogged, as the
+    tools log those themselves where it helps.
+    """
+
+    def log(e: Exception) -> None:
+        if isinstance(e, _CLIENT_ERRORS):
+            logger.error("%s failed: %s", name, e)
+        elif not isinstance(e, ValueError):
+            logger.error("%s unexpected error: %s", name, e, exc_info=True)
+
+    def decorator(func: _F) -> _F:
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                try:
+                    return await func(*args, **kwargs)
+                except Exception as e:
+                    log(e)
+                    raise
+
+            return async_wrapper  # type: ignore[return-value]
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            try:
+                return func(*args, **kwargs)
+            except Exception as e:
+                log(e)
+                raise
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+def _validate_stream_name(stream: str) -> str:
+    if not _STREAM_NAME_RE.fullmatch(stream):
+        raise ValueError(
+            f"Invalid stream name: {stream!r}. Use letters, digits and underscores, "
+            "not starting with a digit."
+        )
+    return stream
+
+
+def _validate_select_sql(sql: str) -> str:
+    if not _SQL_START_RE.match(sql, _SQL_PREAMBLE_RE.match(sql).end()):
+        raise ValueError("Only SELECT (or WITH ... SELECT) queries are allowed")
+    if _SQL_NEXT_STATEMENT_RE.search(_SQL_OPAQUE_RE.sub(" ", sql)):
+        raise ValueError("Multiple SQL statements are not allowed")
+    return sql
+
+
+# Pure in ``path``, and agents keep requesting the same few paths. Rejected
+# paths raise and so are never cached.
+@functools.lru_cache(maxsize=1024)
 def _normalize_api_path(path: str) -> str:
     cleaned = path.strip()
-    if cleaned.startswith("http://") or cleaned.startswith("https://"):
+    if cleaned.startswith(_URL_SCHEMES):
         raise ValueError("Only relative API paths are allowed (no scheme/host)")
     cleaned = cleaned.lstrip("/")
-    if ".." in cleaned.split("/"):
+    # Same as checking for a ".." segment, without splitting into a list
+    if "/../" in f"/{cleaned}/":
         raise ValueError("Path traversal is not allowed")
     return cleaned
 
@@ -96,6 +219,10 @@ def create_mcp_server(
 ) -> FastMCP:
     logger.info("Creating MCP server with max_rows=%d, max_chars=%d", max_rows, max_chars)
 
+    # FastMCP runs synchronous tools directly on its event loop, so the tools are
+    # async and hand the blocking OpenObserveClient calls to worker threads.
+    # Concurrent tool calls then overlap and share the client's connection pool.
+
     mcp = FastMCP(
         name="mcp-server-openobserve",
         instructions=(
@@ -104,20 +231,22 @@ def create_mcp_server(
             "All tools are read-only."
         ),
         auth=auth,
+        # FastMCP's default (pydantic_core.to_json) is already native code, so
+        # only swap it out when orjson is there to beat it
+        tool_serializer=_serialize_tool_result if HAVE_ORJSON else None,
     )
 
-    read_only_annotations = {
-        "readOnlyHint": True,
-        "destructiveHint": False,
-        "openWorldHint": False,
-    }
+    # Fixed for the life of the server; computed once instead of per get_api call
+    allowed_prefix = f"api/{client.org}/"
 
-    open_world_annotations = {
-        "readOnlyHint": True,
-        "destructiveHint": False,
-        "openWorldHint": True,
-    }
+    def _deadline() -> float:
+        # One budget per tool call, started before any queueing for a worker
+        # thread or bulkhead slot. It covers the slot wait, every retry and the
+        # backoff between them; a single read may still block for up to the
+        # remaining budget, so a call ends within about ZO_TIMEOUT of starting
+        return time.monotonic() + client.timeout_s
 
+    @_log_failures("_search_sql_impl")
     def _search_sql_impl(
         sql: str,
         hours: int | None = None,
@@ -125,72 +254,69 @@ def create_mcp_server(
         end_micros: int | None = None,
         size: int = 100,
         offset: int = 0,
+        deadline: float | None = None,
     ) -> Any:
-        logger.info(
-            "_search_sql_impl request: sql=%s hours=%s start_micros=%s end_micros=%s size=%s offset=%s",
-            sql,
-            hours,
-            start_micros,
-            end_micros,
-            size,
-            offset,
-        )
-
         # Validate SQL input
         if not sql or not sql.strip():
             raise ValueError("SQL query cannot be empty")
 
-        # Calculate time range
-        now = int(time.time() * 1_000_000)
+        # Calculate time range; the clock is only read when a bound is relative to now
+        start, end = start_micros, end_micros
         if hours is not None:
             if hours <= 0:
                 raise ValueError(f"hours must be positive, got {hours}")
-            start_micros = now - hours * 60 * 60 * 1_000_000
-            end_micros = now + 60 * 60 * 1_000_000
-
-        start = start_micros if start_micros is not None else (now - 24 * 60 * 60 * 1_000_000)
-        end = end_micros if end_micros is not None else (now + 60 * 60 * 1_000_000)
-
-        # Validate and apply limits
-        effective_size = max(1, int(size))
-        if max_rows > 0:
-            effective_size = min(effective_size, max_rows)
-        effective_offset = max(0, int(offset))
-
+            now = time.time_ns() // 1000
+            start = now - hours * _MICROS_PER_HOUR
+            end = now + _MICROS_PER_HOUR
+        elif start is None or end is None:
+            now = time.time_ns() // 1000
+            if start is None:
+                start = now - _DEFAULT_LOOKBACK_MICROS
+            if end is None:
+                end = now + _MICROS_PER_HOUR
+
+        # Validate and apply limits (inline compares; max()/min() calls cost
+        # more than the clamping itself)
+        effective_size = int(size)
+        if effective_size < 1:
+            effective_size = 1
+        elif 0 < max_rows < effective_size:
+            effective_size = max_rows
+        effective_offset = int(offset)
+        if effective_offset < 0:
+            effective_offset = 0
+
+        # One line per query with the effective window and limits; rejected
+        # arguments are reported by FastMCP with the ValueError
         logger.info(
-            "_search_sql_impl executing: org=%s start=%s end=%s size=%s offset=%s",
+            "_search_sql_impl executing: org=%s sql=%s hours=%s start=%s end=%s size=%s offset=%s",
             client.org,
+            sql,
+            hours,
             start,
             end,
             effective_size,
             effective_offset,
         )
-        logger.debug("SQL query: %s", sql)
 
-        try:
-            result = client.search(
-                sql=sql,
-                start_time_micros=start,
-                end_time_micros=end,
-                size=effective_size,
-                offset=effective_offset,
-            )
-            logger.info("_search_sql_impl completed successfully")
-            return _apply_max_chars(result, max_chars)
-        except (APIError, AuthenticationError, OpenObserveConnectionError) as e:
-            logger.error("_search_sql_impl failed: %s", e)
-            raise
-        except Exception as e:
-            logger.error("_search_sql_impl unexpected error: %s", e, exc_info=True)
-            raise
+        result = client.search(
+            sql=sql,
+            start_time_micros=start,
+            end_time_micros=end,
+            size=effective_size,
+            offset=effective_offset,
+            deadline=deadline,
+        )
+        logger.info("_search_sql_impl completed successfully")
+        return _apply_max_chars(result, max_chars)
 
     @mcp.tool(
         name="search_sql",
         title="Search SQL",
         description="Run an OpenObserve SQL query via /api/{org}/_search.",
-        annotations=read_only_annotations,
+        annotations=_READ_ONLY_ANNOTATIONS,
     )
-    def search_sql(
+    async def search_sql(
         sql: str,
         hours: int | None = None,
         start_micros: int | None = None,
@@ -198,22 +324,33 @@ def create_mcp_server(
         size: int = 100,
         offset: int = 0,
     ) -> Any:
-        return _search_sql_impl(
+        # Reject obvious non-queries here instead of after an OpenObserve round-trip
+        # (empty SQL is left to _search_sql_impl's own check)
+        if sql.strip():
+            try:
+                _validate_select_sql(sql)
+            except ValueError as e:
+                logger.error("search_sql rejected: %s", e)
+                raise
+
+        return await asyncio.to_thread(
+            _search_sql_impl,
             sql=sql,
             hours=hours,
             start_micros=start_micros,
             end_micros=end_micros,
             size=size,
             offset=offset,
+            deadline=_deadline(),
         )
 
     @mcp.tool(
         name="search_logs",
         title="Search Logs",
         description="Search logs in a stream using a full-text query string.",
-        annotations=read_only_annotations,
+        annotations=_READ_ONLY_ANNOTATIONS,
     )
-    def search_logs(
+    async def search_logs(
         query: str,
         stream: str = "default",
         hours: int = 1,
@@ -222,6 +359,12 @@ def create_mcp_server(
     ) -> Any:
         logger.info("search_logs request: query=%s stream=%s hours=%s", query, stream, hours)
 
+        try:
+            _validate_stream_name(stream)
+        except ValueError as e:
+            logger.error("search_logs rejected: %s", e)
+            raise
+
         # Simple escaping for single quotes to prevent basic SQL errors
         safe_query = query.replace("'", "''")
 
@@ -229,20 +372,22 @@ def create_mcp_server(
         # Using match_all which searches across all fields or fields configured for full text
         sql = f"SELECT * FROM {stream} WHERE match_all('{safe_query}')"
 
-        return _search_sql_impl(
+        return await asyncio.to_thread(
+            _search_sql_impl,
             sql=sql,
             hours=hours,
             size=size,
             offset=offset,
+            deadline=_deadline(),
         )
 
     @mcp.tool(
         name="get_log_volume",
         title="Get Log Volume",
         description="Get the volume of logs (count) over time (histogram).",
-        annotations=read_only_annotations,
+        annotations=_READ_ONLY_ANNOTATIONS,
     )
-    def get_log_volume(
+    async def get_log_volume(
         stream: str = "default",
         hours: int = 24,
         interval: str = "1 hour",
@@ -251,27 +396,36 @@ def create_mcp_server(
             "get_log_volume request: stream=%s hours=%s interval=%s", stream, hours, interval
         )
 
+        try:
+            _validate_stream_name(stream)
+        except ValueError as e:
+            logger.error("get_log_volume rejected: %s", e)
+            raise
+
         safe_interval = interval.replace("'", "''")
 
         sql = f"SELECT histogram(_timestamp, '{safe_interval}') AS key, COUNT(*) AS num FROM {stream} GROUP BY key ORDER BY key"
 
-        return _search_sql_impl(
+        return await asyncio.to_thread(
+            _search_sql_impl,
             sql=sql,
             hours=hours,
             size=1000,
             offset=0,
+            deadline=_deadline(),
         )
 
     @mcp.tool(
         name="get_stream_schema",
         title="Get Stream Schema",
         description="Get the schema (field names and types) for a specific stream.",
-        annotations=read_only_annotations,
+        annotations=_READ_ONLY_ANNOTATIONS,
     )
-    def get_stream_schema(stream: str) -> Any:
+    @_log_failures("get_stream_schema")
+    async def get_stream_schema(stream: str) -> Any:
         logger.info("get_stream_schema executing: stream=%s", stream)
         try:
-            result = client.get_stream_schema(stream)
+            result = await asyncio.to_thread(client.get_stream_schema, stream, _deadline())
             logger.info("get_stream_schema completed successfully")
             return _apply_max_chars(result, max_chars)
         except APIError as e:
@@ -287,33 +441,20 @@ def create_mcp_server(
                     ),
                     "suggestion": f"Try querying sample data: SELECT * FROM {stream} LIMIT 1",
                 }
-            logger.error("get_stream_schema failed: %s", e)
-            raise
-        except (AuthenticationError, OpenObserveConnectionError) as e:
-            logger.error("get_stream_schema failed: %s", e)
-            raise
-        except Exception as e:
-            logger.error("get_stream_schema unexpected error: %s", e, exc_info=True)
             raise
 
     @mcp.tool(
         name="list_streams",
         title="List Streams",
         description="List streams for the configured OpenObserve org.",
-        annotations=read_only_annotations,
+        annotations=_READ_ONLY_ANNOTATIONS,
     )
-    def list_streams() -> Any:
+    @_log_failures("list_streams")
+    async def list_streams() -> Any:
         logger.info("list_streams executing: org=%s", client.org)
-        try:
-            result = client.list_streams()
-            logger.info("list_streams completed successfully")
-            return _apply_max_chars(result, max_chars)
-        except (APIError, AuthenticationError, OpenObserveConnectionError) as e:
-            logger.error("list_streams failed: %s", e)
-            raise
-        except Exception as e:
-            logger.error("list_streams unexpected error: %s", e, exc_info=True)
-            raise
+        result = await asyncio.to_thread(client.list_streams, _deadline())
+        logger.info("list_streams completed successfully")
+        return _apply_max_chars(result, max_chars)
 
     @mcp.tool(
         name="get_api",
@@ -321,9 +462,10 @@ def create_mcp_server(
         description=(
             "GET a limited OpenObserve API path. Allowed paths: `healthz`, `api/{org}/...`."
         ),
-        annotations=open_world_annotations,
+        annotations=_OPEN_WORLD_ANNOTATIONS,
     )
-    def get_api(path: str, param: list[str] | None = None) -> Any:
+    @_log_failures("get_api")
+    async def get_api(path: str, param: list[str] | None = None) -> Any:
         logger.debug("get_api request: path=%s param=%s", path, param)
 
         try:
@@ -332,7 +474,6 @@ def create_mcp_server(
             logger.error("Invalid API path: %s - %s", path, e)
             raise
 
-        allowed_prefix = f"api/{client.org}/"
         if cleaned != "healthz" and not cleaned.startswith(allowed_prefix):
             error_msg = f"Path must be 'healthz' or start with '{allowed_prefix}', got '{cleaned}'"
             logger.error(error_msg)
@@ -346,16 +487,11 @@ def create_mcp_server(
 
         logger.info("get_api executing: path=%s params=%s", cleaned, params or None)
 
-        try:
-            result = client.get(cleaned, params=params or None)
-            logger.info("get_api completed successfully")
-            return _apply_max_chars(result, max_chars)
-        except (APIError, AuthenticationError, OpenObserveConnectionError) as e:
-            logger.error("get_api failed: %s", e)
-            raise
-        except Exception as e:
-            logger.error("get_api unexpected error: %s", e, exc_info=True)
-            raise
+        result = await asyncio.to_thread(
+            client.get, cleaned, params=params or None, deadline=_deadline()
+        )
+        logger.info("get_api completed successfully")
+        return _apply_max_chars(result, max_chars)
 
     @mcp.prompt()
     def investigate_errors(stream: str = "default", hours: int = 1) -> str:
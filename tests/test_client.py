@@ -0,0 +1,359 @@
+from __future__ import annotations
+
+import io
+import time
+import types
+from typing import Any
+
+import pytest
+import requests
+
+from mcp_server_openobserve import client as client_module
+from mcp_server_openobserve.client import (
+    APIError,
+    CircuitBreaker,
+    OpenObserveClient,
+    OpenObserveConnectionError,
+    TTLCache,
+)
+
+
+def _response(status: int = 200, body: bytes = b"{}", headers: dict[str, str] | None = None):
+    response = requests.Response()
+    response.status_code = status
+    response._content = body
+    response.raw = io.BytesIO(body)
+    response.headers.update(headers or {})
+    return response
+
+
+class FakeSession:
+    """Stands in for ``requests.Session.request``, replaying queued outcomes."""
+
+    def __init__(self, *outcomes: Any) -> None:
+        self.outcomes = list(outcomes)
+        self.calls: list[dict[str, Any]] = []
+
+    def __call__(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        self.calls.append({"method": method, "url": url, **kwargs})
+        outcome = self.outcomes.pop(0) if len(self.outcomes) > 1 else self.outcomes[0]
+        if isinstance(outcome, BaseException):
+            raise outcome
+        return outcome
+
+
+def _client(monkeypatch: pytest.MonkeyPatch, *outcomes: Any, **kwargs: Any):
+    client = OpenObserveClient(base_url="http://oo.test", access_key="key", **kwargs)
+    session = FakeSession(*(outcomes or (_response(),)))
+    monkeypatch.setattr(client._session, "request", session)
+    return client, session
+
+
+@pytest.fixture
+def sleeps(monkeypatch: pytest.MonkeyPatch) -> list[float]:
+    slept: list[float] = []
+    monkeypatch.setattr("mcp_server_openobserve.client.time.sleep", slept.append)
+    return slept
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> list[float]:
+    """Manual ``time.monotonic`` for the client module; bump ``clock[0]`` to advance."""
+    now = [1000.0]
+    fake_time = types.SimpleNamespace(monotonic=lambda: now[0], sleep=time.sleep, time=time.time)
+    monkeypatch.setattr(client_module, "time", fake_time)
+    return now
+
+
+def test_breaker_opens_after_threshold_failures_in_window(clock):
+    breaker = CircuitBreaker(failure_threshold=3, window_s=30.0, recovery_s=15.0)
+    breaker.on_failure()
+    breaker.on_failure()
+    clock[0] += 31  # the first two fall out of the window
+    breaker.on_failure()
+    breaker.on_failure()
+    assert breaker.state == "closed" and breaker.allow()
+
+    breaker.on_failure()
+    assert breaker.state == "open"
+    assert not breaker.allow()
+    assert breaker.retry_after() == pytest.approx(15.0)
+
+
+def test_breaker_half_open_lets_one_probe_through(clock):
+    breaker = CircuitBreaker(failure_threshold=1, recovery_s=15.0)
+    breaker.on_failure()
+    clock[0] += 15
+    assert breaker.state == "half_open"
+
+    assert breaker.allow()
+    assert not breaker.allow()  # only one probe at a time
+    breaker.on_success()
+    assert breaker.state == "closed" and breaker.allow()
+
+
+def test_failed_probe_reopens_breaker(clock):
+    breaker = CircuitBreaker(failure_threshold=1, recovery_s=15.0)
+    breaker.on_failure()
+    clock[0] += 15
+    assert breaker.allow()
+
+    breaker.on_failure()
+    assert breaker.state == "open"
+    clock[0] += 14
+    assert not breaker.allow()
+    clock[0] += 1
+    assert breaker.allow()
+
+
+def _half_open(client: OpenObserveClient) -> CircuitBreaker:
+    """Swap in a breaker that is tripped and already past its recovery period."""
+    client._breaker = CircuitBreaker(failure_threshold=1, recovery_s=0.0)
+    client._breaker.on_failure()
+    return client._breaker
+
+
+def test_probe_without_bulkhead_slot_does_not_wedge_breaker(monkeypatch):
+    client, session = _client(monkeypatch, _response(body=b'{"list": []}'), max_inflight=1)
+    breaker = _half_open(client)
+    client._inflight.acquire()  # another call holds the only slot
+
+    with pytest.raises(OpenObserveConnectionError, match="Too many concurrent"):
+        client.get("api/default/streams", deadline=time.monotonic() + 0.05)
+    assert not session.calls
+
+    client._inflight.release()
+    assert client.get("api/default/streams") == {"list": []}
+    assert breaker.allow()  # the successful probe closed the breaker
+
+
+def test_interrupted_probe_frees_breaker(monkeypatch):
+    client, session = _client(monkeypatch, KeyboardInterrupt(), _response())
+    breaker = _half_open(client)
+
+    with pytest.raises(KeyboardInterrupt):
+        client.get("api/default/streams")
+
+    assert breaker.allow()  # next call may probe again
+    breaker.release()
+    assert client.get("api/default/streams") == {}
+    assert len(session.calls) == 2
+
+
+def test_expired_deadline_does_not_wedge_probe(monkeypatch):
+    client, session = _client(monkeypatch)
+    breaker = _half_open(client)
+
+    with pytest.raises(OpenObserveConnectionError, match="Deadline exceeded"):
+        client.get("api/default/streams", deadline=time.monotonic() - 1)
+
+    assert not session.calls
+    assert breaker.allow()
+
+
+def test_transient_statuses_are_retried_with_backoff(monkeypatch, sleeps):
+    client, session = _client(monkeypatch, _response(503), _response(502), _response())
+
+    assert client.get("api/default/streams") == {}
+    assert len(session.calls) == 3
+    assert sleeps[0] == 0.0 and 1.0 <= sleeps[1] <= 1.5
+
+
+def test_retry_after_beyond_deadline_is_not_slept(monkeypatch, sleeps):
+    client, session = _client(monkeypatch, _response(429, headers={"Retry-After": "3"}))
+
+    with pytest.raises(APIError) as excinfo:
+        client.get("api/default/streams", deadline=time.monotonic() + 1)
+
+    assert excinfo.value.status_code == 429
+    assert len(session.calls) == 1
+    assert not sleeps
+
+
+def test_attempt_timeouts_come_out_of_deadline(monkeypatch, sleeps):
+    client, session = _client(monkeypatch, _response(503), _response(), timeout_s=30)
+
+    client.get("api/default/streams", deadline=time.monotonic() + 2)
+
+    assert [call["timeout"] <= 2 for call in session.calls] == [True, True]
+
+
+def test_read_timeouts_are_not_retried(monkeypatch, sleeps):
+    client, session = _client(monkeypatch, requests.ReadTimeout())
+
+    with pytest.raises(OpenObserveConnectionError, match="timed out"):
+        client.get("api/default/streams")
+
+    assert len(session.calls) == 1
+
+
+def test_connection_errors_are_retried(monkeypatch, sleeps):
+    client, session = _client(monkeypatch, requests.ConnectionError(), _response())
+
+    assert client.get("api/default/streams") == {}
+    assert len(session.calls) == 2
+
+
+class FakeRaw(io.BytesIO):
+    """Streamed body that runs ``on_read`` before every read."""
+
+    def __init__(self, body: bytes, on_read: Any = None) -> None:
+        super().__init__(body)
+        self.on_read = on_read
+
+    def read(self, size: int | None = -1) -> bytes:
+        if self.on_read is not None:
+            self.on_read()
+        return super().read(size)
+
+
+def _streamed(raw: io.BytesIO) -> requests.Response:
+    response = _response()
+    response._content = False
+    response.raw = raw
+    return response
+
+
+# A trailing LIMIT above ``size`` is what makes search() stream the body
+STREAMED_SQL = "SELECT * FROM logs LIMIT 5000"
+
+
+def test_search_without_large_limit_parses_in_one_shot(monkeypatch):
+    body = b'{"hits": [{"a": 1}, {"a": 2}, {"a": 3}], "total": 3}'
+    client, session = _client(monkeypatch, _response(body=body))
+
+    assert client.search("SELECT * FROM logs", 0, 1, size=2, offset=0) == {
+        "hits": [{"a": 1}, {"a": 2}],
+        "total": 3,
+    }
+    assert "stream" not in session.calls[0]
+
+
+def test_streamed_search_holds_bulkhead_slot_until_body_is_read(monkeypatch):
+    pytest.importorskip("ijson")
+    slot_free: list[bool] = []
+    client, _ = _client(monkeypatch, max_inflight=1)
+
+    def on_read() -> None:
+        free = client._inflight.acquire(blocking=False)
+        if free:
+            client._inflight.release()
+        slot_free.append(free)
+
+    body = b'{"hits": [{"a": 1}, {"a": 2}], "total": 2}'
+    client._session.request.outcomes = [_streamed(FakeRaw(body, on_read))]
+
+    assert client.search(STREAMED_SQL, 0, 1, size=1, offset=0) == {"hits": [{"a": 1}], "total": 2}
+    assert slot_free and not any(slot_free)
+
+
+def test_truncated_search_body_is_a_connection_error(monkeypatch):
+    pytest.importorskip("ijson")
+    client, _ = _client(monkeypatch, _streamed(io.BytesIO(b'{"hits": [{"a"')))
+    client._breaker = CircuitBreaker(failure_threshold=1)
+
+    with pytest.raises(OpenObserveConnectionError, match="Failed to read the response"):
+        client.search(STREAMED_SQL, 0, 1, size=10, offset=0)
+
+    assert not client._breaker.allow()  # the failure was counted
+
+
+def test_search_body_read_stops_at_deadline(monkeypatch):
+    pytest.importorskip("ijson")
+    body = b'{"hits": [' + b",".join([b'{"a": 1}'] * 100_000) + b"]}"
+    raw = FakeRaw(body, on_read=lambda: time.sleep(0.02))
+    client, _ = _client(monkeypatch, _streamed(raw))
+
+    with pytest.raises(OpenObserveConnectionError, match="Deadline exceeded while reading"):
+        client.search(STREAMED_SQL, 0, 1, size=10, offset=0, deadline=time.monotonic() + 0.05)
+
+
+@pytest.mark.parametrize(
+    ("sql", "limit"),
+    [
+        ("SELECT * FROM logs", 0),
+        ("SELECT * FROM logs LIMIT 50", 50),
+        ("select * from logs limit 50 offset 10;", 50),
+        ("SELECT * FROM (SELECT * FROM logs LIMIT 9000) t", 0),
+        ("SELECT * FROM logs LIMIT 5000\n", 5000),
+    ],
+)
+def test_sql_limit_reads_trailing_limit_only(sql, limit):
+    assert client_module._sql_limit(sql) == limit
+
+
+@pytest.mark.parametrize("max_inflight", [1, 10, 64])
+def test_connection_pool_matches_bulkhead(max_inflight):
+    client = OpenObserveClient(base_url="http://oo.test", access_key="key", max_inflight=max_inflight)
+
+    for prefix in ("http://", "https://"):
+        adapter = client._session.get_adapter(prefix + "oo.test")
+        assert adapter.poolmanager.connection_pool_kw["maxsize"] == max_inflight
+
+
+def test_open_breaker_error_says_how_long_to_wait(monkeypatch, clock):
+    client, session = _client(monkeypatch)
+    client._breaker = CircuitBreaker(failure_threshold=1, recovery_s=15.0)
+    client._breaker.on_failure()
+    clock[0] += 0.5
+
+    with pytest.raises(OpenObserveConnectionError, match="for another 15s"):
+        client.get("api/default/streams")
+    assert not session.calls
+
+
+def test_breaker_error_during_probe_does_not_say_zero_seconds(monkeypatch):
+    client, session = _client(monkeypatch)
+    _half_open(client).allow()  # another call's probe is in flight
+
+    with pytest.raises(OpenObserveConnectionError, match="recovery probe is in progress"):
+        client.get("api/default/streams")
+    assert not session.calls
+
+
+def test_ttl_cache_entries_expire(clock):
+    cache = TTLCache(ttl_s=60.0)
+    cache.set("k", b"v")
+    clock[0] += 59.9
+    assert cache.get("k") == b"v"
+    clock[0] += 0.1
+    assert cache.get("k") is None
+
+
+def test_ttl_cache_evicts_oldest_when_full(clock):
+    cache = TTLCache(maxsize=2, ttl_s=60.0)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.set("a", 3)  # re-set moves "a" behind "b"
+    cache.set("c", 4)
+
+    assert cache.get("b") is None
+    assert (cache.get("a"), cache.get("c")) == (3, 4)
+
+
+def test_ttl_cache_with_zero_ttl_stores_nothing():
+    cache = TTLCache(ttl_s=0)
+    cache.set("k", b"v")
+    assert cache.get("k") is None
+
+
+def test_metadata_is_served_from_cache_until_ttl(monkeypatch, clock):
+    client, session = _client(monkeypatch, _response(body=b'{"list": ["a"]}'), meta_ttl_s=60)
+
+    assert client.list_streams() == {"list": ["a"]}
+    first = client.list_streams()
+    first["list"].append("mutated")  # callers get their own copy
+    assert client.list_streams() == {"list": ["a"]}
+    assert len(session.calls) == 1
+
+    clock[0] += 60
+    client.list_streams()
+    assert len(session.calls) == 2
+
+
+def test_metadata_cache_disabled_with_zero_ttl(monkeypatch):
+    client, session = _client(monkeypatch, meta_ttl_s=0)
+
+    client.get_stream_schema("logs")
+    client.get_stream_schema("logs")
+    assert len(session.calls) == 2
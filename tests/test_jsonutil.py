@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from mcp_server_openobserve import jsonutil
+
+PAYLOADS = [
+    {"took": 3, "hits": [{"i": i, "msg": f"line {i} ü \"q\""} for i in range(1000)], "total": 1000},
+    list(range(600)),
+    {"nested": {"deep": [{"a": [1, 2]}] * 300}, "empty": {}, "none": None},
+    {1: "non-str key"},
+    "plain",
+    [],
+]
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def backend(request, monkeypatch):
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(jsonutil, "orjson", None)
+    return request.param
+
+
+@pytest.mark.parametrize("payload", PAYLOADS)
+def test_dumps_prefix_matches_full_encoding_when_it_fits(backend, payload):
+    encoded = jsonutil.dumps_prefix(payload, 10**9, default=str)
+
+    if backend == "stdlib":
+        assert encoded == json.dumps(payload, ensure_ascii=False, default=str)
+    else:
+        assert json.loads(encoded) == json.loads(json.dumps(payload, default=str))
+
+
+@pytest.mark.parametrize("limit", [0, 1, 50, 5000])
+def test_dumps_prefix_overshoots_limit_when_too_big(backend, limit):
+    full = jsonutil.dumps_prefix(PAYLOADS[0], 10**9, default=str)
+    prefix = jsonutil.dumps_prefix(PAYLOADS[0], limit, default=str)
+
+    assert len(prefix) > limit
+    assert full.startswith(prefix)
@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import pytest
+
+from mcp_server_openobserve.server import (
+    _apply_max_chars,
+    _normalize_api_path,
+    _validate_select_sql,
+    _validate_stream_name,
+)
+
+
+@pytest.mark.parametrize(
+    "sql",
+    [
+        "SELECT 1",
+        "  select * FROM logs;  ",
+        "WITH a AS (SELECT 1) SELECT * FROM a",
+        "SELECT * FROM logs WHERE match_all('a; b')",
+        "SELECT 'it''s; fine' FROM logs;",
+        "-- note\nSELECT 1",
+        "/* leading\n block */ SELECT 1",
+        "(SELECT a FROM x) UNION (SELECT a FROM y)",
+        '  ( ( select "we;ird" from logs ) )',
+        'SELECT "col ""quoted""; x" FROM logs',
+        "SELECT 1 -- trailing; comment",
+        "SELECT 1 /* ; */ FROM logs",
+        "SELECT 1; -- nothing follows",
+    ],
+)
+def test_read_queries_are_accepted(sql):
+    assert _validate_select_sql(sql) == sql
+
+
+@pytest.mark.parametrize(
+    "sql",
+    [
+        "DROP STREAM logs",
+        "DELETE FROM logs",
+        "selectx FROM logs",
+        "-- SELECT 1\nDELETE FROM logs",
+        "/* SELECT */ DELETE FROM logs",
+        "(DELETE FROM logs)",
+    ],
+)
+def test_non_read_queries_are_rejected(sql):
+    with pytest.raises(ValueError, match="Only SELECT"):
+        _validate_select_sql(sql)
+
+
+@pytest.mark.parametrize(
+    "sql",
+    [
+        "SELECT 1; SELECT 2",
+        "SELECT 'a'; DROP STREAM logs",
+        'SELECT "a"; DROP STREAM logs',
+        "SELECT 1 /* c */; DROP STREAM logs",
+        "SELECT 'unterminated; DROP STREAM logs",
+    ],
+)
+def test_multiple_statements_are_rejected(sql):
+    with pytest.raises(ValueError, match="Multiple SQL statements"):
+        _validate_select_sql(sql)
+
+
+@pytest.mark.parametrize("stream", ["default", "nginx_logs", "_internal", "Logs2024", "a"])
+def test_plain_identifier_stream_names_are_accepted(stream):
+    assert _validate_stream_name(stream) == stream
+
+
+@pytest.mark.parametrize(
+    "stream",
+    [
+        "",
+        "2024logs",
+        "my-stream",
+        "my stream",
+        "logs;DROP STREAM x",
+        "logs WHERE 1=1 --",
+        '"quoted"',
+        "logs.other",
+        "logs\n",
+        "éclair",
+    ],
+)
+def test_other_stream_names_are_rejected(stream):
+    with pytest.raises(ValueError, match="Invalid stream name"):
+        _validate_stream_name(stream)
+
+
+@pytest.mark.parametrize(
+    ("path", "normalized"),
+    [
+        ("api/default/streams", "api/default/streams"),
+        ("  /api/default/streams ", "api/default/streams"),
+        ("//api/x", "api/x"),
+        ("a/..b", "a/..b"),
+        ("..b/c", "..b/c"),
+        ("a/b..", "a/b.."),
+        ("a/.../b", "a/.../b"),
+        ("a/./b", "a/./b"),
+    ],
+)
+def test_api_paths_are_normalized(path, normalized):
+    assert _normalize_api_path(path) == normalized
+
+
+@pytest.mark.parametrize(
+    "path",
+    ["..", "/..", "a/..", "a/../b", "../etc", "/../x", "a//..//b", "a/b/../../..", "a/../"],
+)
+def test_dot_dot_segments_are_rejected(path):
+    with pytest.raises(ValueError, match="Path traversal"):
+        _normalize_api_path(path)
+
+
+@pytest.mark.parametrize("path", ["http://evil/api", "https://oo.test/api/default", " https://x"])
+def test_absolute_urls_are_rejected(path):
+    with pytest.raises(ValueError, match="Only relative API paths"):
+        _normalize_api_path(path)
+
+
+@pytest.mark.parametrize("payload", ["short", b"short", bytearray(b"short")])
+def test_text_payloads_within_limit_are_returned_unchanged(payload):
+    assert _apply_max_chars(payload, 5) is payload
+
+
+def test_long_text_payload_is_previewed_without_json_escaping():
+    assert _apply_max_chars('a"b' * 10, 4) == {"truncated": True, "max_chars": 4, "preview": 'a"ba'}
+
+
+def test_long_bytes_payload_decodes_only_the_preview():
+    payload = "é".encode() * 10  # 20 bytes
+
+    assert _apply_max_chars(payload, 5) == {"truncated": True, "max_chars": 5, "preview": "éé"}